@@ -28,8 +28,9 @@ Example:
     ... )
 """
 
-from .dataframe import DataFrame
-from .datasets import DatasetsManager
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
 from .exceptions import (
     DatasetNotFoundError,
     DatasetValidationError,
@@ -45,23 +46,59 @@ from .lineage import (
     SourceLocation,
 )
 
-# Import pandas module for pd-like interface
-from . import pandas
-
 # Import validation utilities
 from .validation import (
     ImportCheckResult,
     check_notebook_imports,
     check_script_imports,
     validate_project_notebooks,
+    validate_project_notebooks_async,
 )
 
+if TYPE_CHECKING:
+    from . import pandas
+    from .dataframe import DataFrame, enable_global_cow, set_default_strict
+    from .datasets import DatasetsManager
+
+# Attributes that import pandas, requests and the YAML libraries, loaded on first
+# access (PEP 562) so that `import sunstone` stays cheap for validation-only use
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "DataFrame": ("sunstone.dataframe", "DataFrame"),
+    "DatasetsManager": ("sunstone.datasets", "DatasetsManager"),
+    "set_default_strict": ("sunstone.dataframe", "set_default_strict"),
+    "enable_global_cow": ("sunstone.dataframe", "enable_global_cow"),
+}
+
+# Pandas-like interface, e.g. `from sunstone import pandas as pd`
+_LAZY_SUBMODULES = frozenset({"pandas"})
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily loaded attributes on first access."""
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including lazily loaded ones."""
+    return sorted(set(globals()) | set(__all__))
+
+
 __version__ = "0.1.0"
 
 __all__ = [
     # Main classes
     "DataFrame",
     "DatasetsManager",
+    "set_default_strict",
+    "enable_global_cow",
     # Pandas-like interface
     "pandas",
     # Validation utilities
@@ -69,6 +106,7 @@ __all__ = [
     "check_notebook_imports",
     "check_script_imports",
     "validate_project_notebooks",
+    "validate_project_notebooks_async",
     # Lineage classes
     "LineageMetadata",
     "DatasetMetadata",
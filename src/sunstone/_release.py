@@ -12,6 +12,7 @@ import subprocess
 import sys
 from datetime import date
 from pathlib import Path
+from typing import Any, Dict
 
 try:
     import tomllib
@@ -24,6 +25,14 @@ except ModuleNotFoundError:
     print("Error: tomli_w not found. Install with: uv add --dev tomli-w", file=sys.stderr)
     sys.exit(1)
 
+_SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+
+# The Unreleased section of CHANGELOG.md, followed by the previous version's header
+_UNRELEASED_RE = re.compile(r"(## \[Unreleased\]\n)(.*?)(## \[\d)", re.DOTALL)
+
+# The Unreleased section when it is the last section of CHANGELOG.md
+_UNRELEASED_TAIL_RE = re.compile(r"(## \[Unreleased\]\n)(.*?)$", re.DOTALL)
+
 
 def get_root_dir() -> Path:
     """Get the root directory (where pyproject.toml lives)."""
@@ -136,31 +145,22 @@ def check_up_to_date_with_origin() -> None:
         print("Error: Failed to fetch from origin", file=sys.stderr)
         sys.exit(1)
 
-    # Get local and remote commit hashes
-    local = run_git("rev-parse", "HEAD")
-    remote = run_git("rev-parse", "origin/main")
-
-    if local.returncode != 0 or remote.returncode != 0:
-        print("Error: Failed to get commit hashes", file=sys.stderr)
+    # Count commits only on HEAD (ahead) and only on origin/main (behind)
+    result = run_git("rev-list", "--left-right", "--count", "HEAD...origin/main")
+    if result.returncode != 0:
+        print("Error: Failed to compare with origin/main", file=sys.stderr)
         sys.exit(1)
 
-    local_hash = local.stdout.strip()
-    remote_hash = remote.stdout.strip()
+    ahead, behind = (int(count) for count in result.stdout.split())
 
-    if local_hash != remote_hash:
-        # Check if local is behind
-        merge_base = run_git("merge-base", "HEAD", "origin/main")
-        if merge_base.returncode != 0:
-            print("Error: Failed to find merge base", file=sys.stderr)
-            sys.exit(1)
-
-        base_hash = merge_base.stdout.strip()
-        if base_hash == local_hash:
-            print("Error: Local main is behind origin/main. Pull first.", file=sys.stderr)
-        elif base_hash == remote_hash:
-            print("Error: Local main is ahead of origin/main. Push first.", file=sys.stderr)
-        else:
-            print("Error: Local main has diverged from origin/main.", file=sys.stderr)
+    if ahead and behind:
+        print("Error: Local main has diverged from origin/main.", file=sys.stderr)
+        sys.exit(1)
+    if behind:
+        print("Error: Local main is behind origin/main. Pull first.", file=sys.stderr)
+        sys.exit(1)
+    if ahead:
+        print("Error: Local main is ahead of origin/main. Push first.", file=sys.stderr)
         sys.exit(1)
 
 
@@ -193,19 +193,15 @@ def generate_changelog_from_git() -> str:
     return claude_result.stdout.strip()
 
 
-def populate_unreleased(content: str) -> None:
+def populate_unreleased(changelog: str, content: str) -> str:
     """Insert generated changelog content into Unreleased section."""
     if not content:
-        return
+        return changelog
 
-    changelog_path = get_root_dir() / "CHANGELOG.md"
-    existing = changelog_path.read_text()
-
-    new_content = existing.replace(
+    return changelog.replace(
         "## [Unreleased]\n",
         f"## [Unreleased]\n\n{content}\n",
     )
-    changelog_path.write_text(new_content)
 
 
 def open_in_editor(file_path: Path) -> None:
@@ -224,12 +220,15 @@ def confirm_release(new_version: str) -> bool:
         return False
 
 
-def get_current_version() -> str:
-    """Get the current version from pyproject.toml."""
-    pyproject_path = get_root_dir() / "pyproject.toml"
-    with open(pyproject_path, "rb") as f:
-        data = tomllib.load(f)
-    version = data.get("project", {}).get("version")
+def load_pyproject() -> Dict[str, Any]:
+    """Read and parse pyproject.toml."""
+    with open(get_root_dir() / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)
+
+
+def get_current_version(pyproject: Dict[str, Any]) -> str:
+    """Get the current version from the parsed pyproject.toml."""
+    version = pyproject.get("project", {}).get("version")
     if not version:
         print("Error: Could not find version in pyproject.toml", file=sys.stderr)
         sys.exit(1)
@@ -238,7 +237,7 @@ def get_current_version() -> str:
 
 def bump_version(version: str, bump: str) -> str:
     """Bump the version according to semver."""
-    match = re.match(r"^(\d+)\.(\d+)\.(\d+)$", version)
+    match = _SEMVER_RE.match(version)
     if not match:
         print(f"Error: Invalid version format: {version}", file=sys.stderr)
         sys.exit(1)
@@ -253,23 +252,16 @@ def bump_version(version: str, bump: str) -> str:
         return f"{major}.{minor}.{patch + 1}"
 
 
-def update_pyproject_version(new_version: str) -> None:
-    """Update the version in pyproject.toml."""
-    pyproject_path = get_root_dir() / "pyproject.toml"
-    with open(pyproject_path, "rb") as f:
-        data = tomllib.load(f)
-
-    data["project"]["version"] = new_version
+def update_pyproject_version(pyproject: Dict[str, Any], new_version: str) -> None:
+    """Update the version in the parsed pyproject.toml and write it back."""
+    pyproject["project"]["version"] = new_version
 
-    with open(pyproject_path, "wb") as f:
-        tomli_w.dump(data, f)
+    with open(get_root_dir() / "pyproject.toml", "wb") as f:
+        tomli_w.dump(pyproject, f)
 
 
-def update_changelog(new_version: str) -> None:
-    """Update CHANGELOG.md to move Unreleased to the new version."""
-    changelog_path = get_root_dir() / "CHANGELOG.md"
-    content = changelog_path.read_text()
-
+def update_changelog(content: str, new_version: str) -> str:
+    """Move the Unreleased section of CHANGELOG.md content to the new version."""
     today = date.today().isoformat()
 
     # Replace [Unreleased] section header with new version
@@ -278,8 +270,7 @@ def update_changelog(new_version: str) -> None:
     version_header = f"## [{new_version}] - {today}\n"
 
     # Find the Unreleased section and the content until next version
-    pattern = r"(## \[Unreleased\]\n)(.*?)(## \[\d)"
-    match = re.search(pattern, content, re.DOTALL)
+    match = _UNRELEASED_RE.search(content)
 
     if match:
         unreleased_content = match.group(2)
@@ -297,8 +288,7 @@ def update_changelog(new_version: str) -> None:
             )
     else:
         # Unreleased is at the end or there's no previous version
-        pattern = r"(## \[Unreleased\]\n)(.*?)$"
-        match = re.search(pattern, content, re.DOTALL)
+        match = _UNRELEASED_TAIL_RE.search(content)
         if match:
             unreleased_content = match.group(2)
             new_content = content.replace(
@@ -309,7 +299,7 @@ def update_changelog(new_version: str) -> None:
             print("Error: Could not find [Unreleased] section in CHANGELOG.md", file=sys.stderr)
             sys.exit(1)
 
-    changelog_path.write_text(new_content)
+    return new_content
 
 
 def git_commit_and_tag(new_version: str) -> None:
@@ -406,7 +396,8 @@ Examples:
     check_ci_passed()
     print("All checks passed.")
 
-    current_version = get_current_version()
+    pyproject = load_pyproject()
+    current_version = get_current_version(pyproject)
     new_version = bump_version(current_version, bump)
 
     print(f"Version: {current_version} -> {new_version}")
@@ -415,16 +406,19 @@ Examples:
         print("Dry run - no changes made.")
         return
 
+    changelog_path = get_root_dir() / "CHANGELOG.md"
+    changelog = changelog_path.read_text()
+
     # Generate and populate changelog entries
     changelog_content = generate_changelog_from_git()
     if changelog_content:
-        populate_unreleased(changelog_content)
+        changelog = populate_unreleased(changelog, changelog_content)
         print("Generated changelog entries from git commits.")
     else:
         print("No new commits to generate changelog from.")
 
     print("Updating pyproject.toml...")
-    update_pyproject_version(new_version)
+    update_pyproject_version(pyproject, new_version)
 
     print("Syncing uv.lock...")
     uv_result = subprocess.run(["uv", "sync"], cwd=get_root_dir(), capture_output=True, text=True)
@@ -434,10 +428,9 @@ Examples:
         sys.exit(1)
 
     print("Updating CHANGELOG.md...")
-    update_changelog(new_version)
+    changelog_path.write_text(update_changelog(changelog, new_version))
 
     # Open in editor for review
-    changelog_path = get_root_dir() / "CHANGELOG.md"
     print(f"\nOpening {changelog_path} for review...")
     open_in_editor(changelog_path)
 
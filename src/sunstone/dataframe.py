@@ -2,9 +2,15 @@
 DataFrame wrapper with lineage tracking for Sunstone projects.
 """
 
+import contextlib
+import functools
+import importlib.util
+import inspect
 import os
+import threading
+import types
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Set, Tuple, TypeVar, Union, cast
 
 import pandas as pd
 
@@ -12,7 +18,353 @@ from .datasets import DatasetsManager
 from .exceptions import DatasetNotFoundError, StrictModeError
 from .lineage import FieldSchema, LineageMetadata, compute_dataframe_hash
 
-pd.options.mode.copy_on_write = True
+# pandas 3 always uses copy-on-write and deprecates the option
+_ALWAYS_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Pandas indexers, returned as-is so that assignments through them modify the data
+_INDEXERS = frozenset({"loc", "iloc", "at", "iat"})
+
+# Pandas DataFrame methods that return a Series, scalar or other non-DataFrame value
+_SCALAR_METHODS = frozenset(
+    {
+        "all",
+        "any",
+        "count",
+        "equals",
+        "idxmax",
+        "idxmin",
+        "kurt",
+        "max",
+        "mean",
+        "median",
+        "memory_usage",
+        "min",
+        "nunique",
+        "prod",
+        "sem",
+        "skew",
+        "std",
+        "sum",
+        "to_dict",
+        "to_json",
+        "to_numpy",
+        "to_records",
+        "to_string",
+        "var",
+    }
+)
+
+# Per-thread state for DataFrame.no_lineage()
+_lineage_state = threading.local()
+
+# PyArrow's multi-threaded CSV parser is used for reading when it is installed and SUNSTONE_FAST_IO is set
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Process-wide default strict mode set by set_default_strict(); None defers to the environment
+_default_strict: Optional[bool] = None
+
+# Output directories already created by to_csv()
+_known_dirs: Set[str] = set()
+
+# Frequently accessed attributes that never return a DataFrame
+_PASSTHROUGH_SCALARS = frozenset({"shape", "columns", "index", "dtypes", "size", "ndim", "empty"})
+
+
+def _copy_on_write() -> ContextManager[Any]:
+    """Enable pandas copy-on-write for the duration of a context, unless it is already enabled."""
+    if _ALWAYS_COPY_ON_WRITE or pd.options.mode.copy_on_write is True:
+        return contextlib.nullcontext()
+    return pd.option_context("mode.copy_on_write", True)
+
+
+def _with_copy_on_write(func: _F) -> _F:
+    """
+    Run a DataFrame method with pandas copy-on-write enabled.
+
+    Copy-on-write lets Sunstone DataFrames share data with the DataFrames they
+    were derived from without defensive copies. Sunstone enables it globally on
+    import, which makes this a no-op. When that was opted out of with
+    SUNSTONE_GLOBAL_COW, this is only a best effort for Sunstone's own reads,
+    combinations and column assignments: pandas 2 doesn't support switching
+    copy-on-write for individual calls, so there is then no guarantee that writes
+    to a derived DataFrame leave the data it came from unchanged.
+
+    Args:
+        func: The function to wrap.
+
+    Returns:
+        The wrapped function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _copy_on_write():
+            return func(*args, **kwargs)
+
+    return cast(_F, wrapper)
+
+
+def enable_global_cow() -> None:
+    """
+    Enable pandas copy-on-write globally, for all DataFrames in the process.
+
+    Sunstone does this on import unless SUNSTONE_GLOBAL_COW is set to "0" or
+    "false"; call this to enable it later after opting out. This is a no-op with
+    pandas 3, which always uses it.
+    """
+    if not _ALWAYS_COPY_ON_WRITE:
+        pd.options.mode.copy_on_write = True
+
+
+# Copy-on-write is enabled for the whole process, so that writes to a derived DataFrame,
+# including through .loc and .iloc, never modify the DataFrame or input data it came from
+if os.environ.get("SUNSTONE_GLOBAL_COW", "").lower() not in ("0", "false"):
+    enable_global_cow()
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_absolute_path(path: str) -> str:
+    """Resolve symlinks in an absolute path, caching the result."""
+    return str(Path(path).resolve())
+
+
+def _resolve_project_path(project_path: Union[str, Path]) -> str:
+    """
+    Resolve a project path to a canonical absolute path.
+
+    The path is made absolute first, so relative paths still follow the
+    current working directory; only the filesystem lookups are cached.
+
+    Args:
+        project_path: Path to the project directory.
+
+    Returns:
+        The resolved path as a string.
+    """
+    return _resolve_absolute_path(os.path.abspath(project_path))
+
+
+# Dataset field types by dtype.kind, which NumPy and pandas extension dtypes share
+_KIND_TO_TYPE = {
+    "i": "integer",
+    "u": "integer",
+    "f": "number",
+    "b": "boolean",
+    "M": "datetime",
+    "m": "string",
+    "c": "string",
+    "O": "string",
+    "U": "string",
+    "S": "string",
+    "V": "string",
+}
+
+
+def _extension_field_type(dtype: Any) -> str:
+    """Map a pandas extension dtype to a dataset field type."""
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    elif pd.api.types.is_float_dtype(dtype):
+        return "number"
+    elif pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    elif pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    return "string"
+
+
+@functools.lru_cache(maxsize=128)
+def _infer_fields(columns: Tuple[Tuple[str, Any], ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Map column names and pandas dtypes to dataset field types.
+
+    Cached so that outputs sharing the same columns and dtypes are only
+    inspected once. Plain (name, type) pairs are cached rather than
+    FieldSchema objects, which callers may modify.
+
+    Args:
+        columns: Pairs of (column name, dtype).
+
+    Returns:
+        Tuple of (field name, field type) pairs, one per column.
+    """
+    fields = []
+    for name, dtype in columns:
+        field_type = _KIND_TO_TYPE.get(dtype.kind, "string")
+        if field_type == "string" and isinstance(dtype, pd.api.extensions.ExtensionDtype):
+            # Extension dtypes backed by Python objects may still be numeric (e.g. Arrow decimals)
+            field_type = _extension_field_type(dtype)
+
+        fields.append((name, field_type))
+
+    return tuple(fields)
+
+
+def _delegating_method(name: str) -> Callable[..., Any]:
+    """
+    Create a method that calls a pandas DataFrame method on the wrapped data.
+
+    Args:
+        name: Name of the pandas DataFrame method.
+
+    Returns:
+        A function that calls the method and wraps DataFrame results, unless the
+        method never returns a DataFrame.
+    """
+
+    if name in _SCALAR_METHODS:
+
+        def method(self: "DataFrame", *args: Any, **kwargs: Any) -> Any:
+            return getattr(self.data, name)(*args, **kwargs)
+
+    else:
+
+        def method(self: "DataFrame", *args: Any, **kwargs: Any) -> Any:
+            return self._wrap_result(getattr(self.data, name)(*args, **kwargs))
+
+    method.__name__ = name
+    return method
+
+
+class _DelegatedAttribute:
+    """
+    Descriptor that reads a pandas DataFrame property of the wrapped data.
+
+    It only defines __get__, so like any non-data descriptor it is shadowed by
+    instance attributes of the same name, as assignments to DataFrame attributes
+    always have been.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wrap = name not in _PASSTHROUGH_SCALARS
+
+    def __get__(self, instance: Optional["DataFrame"], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        value = getattr(instance.data, self.name)
+        return instance._wrap_result(value) if self.wrap else value
+
+
+def _make_delegate(name: str) -> Any:
+    """
+    Build the class attribute that delegates a public pandas DataFrame attribute.
+
+    The decision is made from the attribute's static definition on pandas.DataFrame:
+    methods and properties get a delegate, while accessors, axis properties and
+    anything else are left to __getattr__.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        A function or descriptor to install on DataFrame, or None.
+    """
+    if name.startswith("_"):
+        return None
+    static = inspect.getattr_static(pd.DataFrame, name, None)
+    if isinstance(static, types.FunctionType):
+        return _delegating_method(name)
+    if isinstance(static, property):
+        return _DelegatedAttribute(name)
+    return None
+
+
+def _fast_io() -> bool:
+    """Whether SUNSTONE_FAST_IO enables reading through pyarrow."""
+    return _HAS_PYARROW and os.environ.get("SUNSTONE_FAST_IO", "").lower() in ("1", "true")
+
+
+def _read_csv(path: Union[str, Path], **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a CSV file, using the pyarrow engine when SUNSTONE_FAST_IO is enabled.
+
+    The pyarrow engine is opt-in because it infers some types differently from the
+    default engine, e.g. ISO dates as datetimes, which changes inferred field types
+    and content hashes. The default pandas engine is used if pyarrow is not
+    installed, an engine was requested explicitly, or the options are not
+    supported by the pyarrow engine.
+
+    Args:
+        path: Path to the CSV file.
+        **kwargs: Additional arguments passed to pandas.read_csv.
+
+    Returns:
+        The pandas DataFrame read from the file.
+    """
+    if "engine" not in kwargs and _fast_io():
+        try:
+            return cast(pd.DataFrame, pd.read_csv(path, engine="pyarrow", **kwargs))
+        except ValueError as e:
+            # Only fall back for options the engine doesn't support, not for invalid data
+            if "'pyarrow' engine" not in str(e):
+                raise
+    return cast(pd.DataFrame, pd.read_csv(path, **kwargs))
+
+
+def _read_parquet(path: Union[str, Path], **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a Parquet file, converting it without copies when SUNSTONE_FAST_IO is enabled.
+
+    With SUNSTONE_FAST_IO set to "1" or "true" and pyarrow installed, the table is
+    read with pyarrow and converted to pandas one column block at a time, releasing
+    each Arrow buffer as it is converted. This roughly halves peak memory for large
+    files, at the cost of an unconsolidated DataFrame. Otherwise, or if options
+    other than ``columns`` are given, pandas.read_parquet is used.
+
+    Args:
+        path: Path to the Parquet file.
+        **kwargs: Additional arguments passed to pandas.read_parquet.
+
+    Returns:
+        The pandas DataFrame read from the file.
+    """
+    if _fast_io() and kwargs.keys() <= {"columns"}:
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        table = pq.read_table(path, columns=kwargs.get("columns"))
+        return cast(pd.DataFrame, table.to_pandas(split_blocks=True, self_destruct=True))
+    return cast(pd.DataFrame, pd.read_parquet(path, **kwargs))
+
+
+# File formats by file extension, for read_dataset() format auto-detection
+_EXT_TO_FORMAT: Dict[str, str] = {
+    ".csv": "csv",
+    ".json": "json",
+    ".xlsx": "excel",
+    ".xls": "excel",
+    ".parquet": "parquet",
+    ".tsv": "tsv",
+    ".txt": "tsv",  # Assume tab-delimited for .txt
+}
+
+# Pandas reader functions by file format
+_FORMAT_TO_READER: Dict[str, Callable[..., pd.DataFrame]] = {
+    "csv": _read_csv,
+    "json": pd.read_json,
+    "excel": pd.read_excel,
+    "parquet": _read_parquet,
+    "tsv": functools.partial(_read_csv, sep="\t"),
+}
+
+_SUPPORTED_EXTS_STR = ", ".join(_EXT_TO_FORMAT)
+_SUPPORTED_FORMATS_STR = ", ".join(_FORMAT_TO_READER)
+
+
+def set_default_strict(strict: Optional[bool]) -> None:
+    """
+    Set the default strict mode for DataFrames created without an explicit strict argument.
+
+    This takes precedence over the SUNSTONE_DATAFRAME_STRICT environment variable,
+    which is otherwise read each time a DataFrame is created.
+
+    Args:
+        strict: Default strict mode, or None to use the environment variable again.
+    """
+    global _default_strict
+    _default_strict = strict
 
 
 class DataFrame:
@@ -28,6 +380,9 @@ class DataFrame:
         strict_mode: Whether to operate in strict mode.
     """
 
+    _lineage: Optional[LineageMetadata] = None
+    _parent_lineage: Optional[LineageMetadata] = None
+
     def __init__(
         self,
         data: Any = None,
@@ -67,25 +422,37 @@ class DataFrame:
         self.lineage = lineage if lineage is not None else LineageMetadata()
 
         # Determine strict mode
-        if strict is None:
-            env_strict = os.environ.get("SUNSTONE_DATAFRAME_STRICT", "").lower()
-            self.strict_mode = env_strict in ("1", "true")
-        else:
-            self.strict_mode = strict
+        self.strict_mode = self._get_default_strict_mode() if strict is None else strict
 
         # Set project path
         if project_path is not None:
-            self.lineage.project_path = str(Path(project_path).resolve())
+            self.lineage.project_path = _resolve_project_path(project_path)
         elif self.lineage.project_path is None:
             self.lineage.project_path = str(Path.cwd())
 
+    @property
+    def lineage(self) -> LineageMetadata:
+        """Lineage metadata tracking data provenance."""
+        lineage = self._lineage
+        if lineage is None:
+            # Derived DataFrames create their lineage from the parent's on first access
+            lineage = self._lineage = cast(LineageMetadata, self._parent_lineage).derive()
+            self._parent_lineage = None
+        return lineage
+
+    @lineage.setter
+    def lineage(self, lineage: LineageMetadata) -> None:
+        self._lineage = lineage
+        self._parent_lineage = None
+
     def _get_datasets_manager(self) -> DatasetsManager:
         """Get a DatasetsManager for the current project."""
         if self.lineage.project_path is None:
             raise ValueError("Project path not set")
-        return DatasetsManager(self.lineage.project_path)
+        return DatasetsManager.get(self.lineage.project_path)
 
     @classmethod
+    @_with_copy_on_write
     def read_dataset(
         cls,
         slug: str,
@@ -116,7 +483,9 @@ class DataFrame:
                           automatically fetch from URL.
             format: Optional format override ('csv', 'json', 'excel', 'parquet', 'tsv').
                    If not provided, format is auto-detected from file extension.
-            **kwargs: Additional arguments passed to the pandas reader function.
+            **kwargs: Additional arguments passed to the pandas reader function. CSV and
+                     TSV files are read with the pyarrow engine when SUNSTONE_FAST_IO
+                     is enabled; pass engine="c" to use the default pandas engine.
 
         Returns:
             A new Sunstone DataFrame with lineage metadata.
@@ -133,10 +502,143 @@ class DataFrame:
             >>> # Explicitly specify format
             >>> df = DataFrame.read_dataset('my-data', format='json', project_path='/path/to/project')
         """
+        absolute_path, format, lineage = cls._locate_dataset(slug, project_path, fetch_from_url, format)
+
+        # Read using appropriate pandas function
+        reader = _FORMAT_TO_READER.get(format)
+        if reader is None:
+            raise ValueError(f"Unsupported format '{format}'. Supported formats: {_SUPPORTED_FORMATS_STR}")
+
+        df = reader(os.fspath(absolute_path), **kwargs)
+
+        # Return wrapped DataFrame; the lineage already has the resolved project path
+        return cls(data=df, lineage=lineage, strict=strict)
+
+    @classmethod
+    def iter_dataset(
+        cls,
+        slug: str,
+        chunksize: int,
+        project_path: Optional[Union[str, Path]] = None,
+        strict: Optional[bool] = None,
+        fetch_from_url: bool = True,
+        format: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator["DataFrame"]:
+        """
+        Read a dataset by slug from datasets.yaml in chunks of rows.
+
+        Only one chunk is held in memory at a time, so datasets larger than memory
+        can be processed incrementally. Each chunk is a Sunstone DataFrame with the
+        dataset as its lineage source.
+
+        Supported formats:
+        - CSV (.csv)
+        - TSV (.tsv, .txt with tab delimiter)
+        - Parquet (.parquet, requires pyarrow)
+
+        Args:
+            slug: Dataset slug to look up in datasets.yaml.
+            chunksize: Number of rows per chunk.
+            project_path: Path to project directory containing datasets.yaml.
+            strict: Whether to operate in strict mode.
+            fetch_from_url: If True and dataset has a source URL but no local file,
+                          automatically fetch from URL.
+            format: Optional format override ('csv', 'parquet', 'tsv').
+                   If not provided, format is auto-detected from file extension.
+            **kwargs: Additional arguments passed to pandas.read_csv, or
+                     pyarrow.parquet.ParquetFile.iter_batches for Parquet.
+
+        Returns:
+            An iterator of Sunstone DataFrames with at most chunksize rows each.
+
+        Raises:
+            DatasetNotFoundError: If dataset with slug not found in datasets.yaml.
+            FileNotFoundError: If datasets.yaml doesn't exist.
+            ValueError: If format cannot be detected or does not support chunked reads.
+
+        Examples:
+            >>> for chunk in DataFrame.iter_dataset('large-dataset', chunksize=100_000):
+            ...     totals.append(chunk.groupby('country')['amount'].sum())
+        """
+        absolute_path, format, lineage = cls._locate_dataset(slug, project_path, fetch_from_url, format)
+        if format not in ("csv", "tsv", "parquet"):
+            raise ValueError(f"Format '{format}' does not support chunked reads. Supported formats: csv, parquet, tsv")
+        if format == "tsv":
+            kwargs.setdefault("sep", "\t")
+
+        # The lookup above has already raised any errors; the file is only opened once iterated
+        return cls._iter_chunks(os.fspath(absolute_path), format, chunksize, lineage, strict, kwargs)
+
+    @classmethod
+    def _iter_chunks(
+        cls,
+        path: str,
+        format: str,
+        chunksize: int,
+        lineage: LineageMetadata,
+        strict: Optional[bool],
+        kwargs: Dict[str, Any],
+    ) -> Iterator["DataFrame"]:
+        """
+        Read a dataset file in chunks of rows, see iter_dataset().
+
+        The file is opened when iteration starts and closed when it finishes or the
+        iterator is closed or garbage collected, so abandoned iterations don't leak
+        file handles.
+
+        Args:
+            path: Absolute path to the dataset file.
+            format: The file's format ('csv', 'parquet' or 'tsv').
+            chunksize: Number of rows per chunk.
+            lineage: Lineage of the dataset, which each chunk derives from.
+            strict: Whether to operate in strict mode.
+            kwargs: Additional arguments for the reader.
+
+        Yields:
+            Sunstone DataFrames with at most chunksize rows each.
+        """
+        if format == "parquet":
+            import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+            with pq.ParquetFile(path) as parquet_file:
+                for batch in parquet_file.iter_batches(batch_size=chunksize, **kwargs):
+                    yield cls(data=batch.to_pandas(), lineage=lineage.derive(), strict=strict)
+        else:
+            with pd.read_csv(path, chunksize=chunksize, **kwargs) as reader:
+                for chunk in reader:
+                    yield cls(data=chunk, lineage=lineage.derive(), strict=strict)
+
+    @classmethod
+    def _locate_dataset(
+        cls,
+        slug: str,
+        project_path: Optional[Union[str, Path]],
+        fetch_from_url: bool,
+        format: Optional[str],
+    ) -> Tuple[Path, str, LineageMetadata]:
+        """
+        Look up a dataset by slug and locate its file for reading.
+
+        Args:
+            slug: Dataset slug to look up in datasets.yaml.
+            project_path: Path to project directory containing datasets.yaml.
+            fetch_from_url: Whether to fetch the file from its source URL if missing.
+            format: Optional format override; auto-detected from the extension if None.
+
+        Returns:
+            Tuple of the absolute file path, the file format, and lineage metadata
+            with the dataset as its source.
+
+        Raises:
+            DatasetNotFoundError: If dataset with slug not found in datasets.yaml.
+            FileNotFoundError: If the file is missing and cannot be fetched.
+            ValueError: If format cannot be detected.
+        """
         if project_path is None:
             project_path = Path.cwd()
 
-        manager = DatasetsManager(project_path)
+        manager = DatasetsManager.get(project_path)
 
         # Look up by slug
         dataset = manager.find_dataset_by_slug(slug)
@@ -161,46 +663,22 @@ class DataFrame:
         if format is None:
             # Auto-detect from file extension
             extension = absolute_path.suffix.lower()
-            format_map = {
-                ".csv": "csv",
-                ".json": "json",
-                ".xlsx": "excel",
-                ".xls": "excel",
-                ".parquet": "parquet",
-                ".tsv": "tsv",
-                ".txt": "tsv",  # Assume tab-delimited for .txt
-            }
-            format = format_map.get(extension)
+            format = _EXT_TO_FORMAT.get(extension)
             if format is None:
                 raise ValueError(
                     f"Cannot auto-detect format for file extension '{extension}'. "
-                    f"Supported extensions: {', '.join(format_map.keys())}. "
+                    f"Supported extensions: {_SUPPORTED_EXTS_STR}. "
                     f"Please specify format explicitly using the 'format' parameter."
                 )
 
-        # Read using appropriate pandas function
-        reader_map: dict[str, Callable[..., pd.DataFrame]] = {
-            "csv": pd.read_csv,
-            "json": pd.read_json,
-            "excel": pd.read_excel,
-            "parquet": pd.read_parquet,
-            "tsv": lambda path, **kw: pd.read_csv(path, sep="\t", **kw),
-        }
-
-        reader = reader_map.get(format)
-        if reader is None:
-            raise ValueError(f"Unsupported format '{format}'. Supported formats: {', '.join(reader_map.keys())}")
-
-        df = reader(absolute_path, **kwargs)
-
         # Create lineage metadata
         lineage = LineageMetadata(project_path=str(manager.project_path))
         lineage.add_source(dataset)
 
-        # Return wrapped DataFrame
-        return cls(data=df, lineage=lineage, strict=strict, project_path=project_path)
+        return absolute_path, format, lineage
 
     @classmethod
+    @_with_copy_on_write
     def read_csv(
         cls,
         filepath_or_buffer: Union[str, Path],
@@ -223,7 +701,9 @@ class DataFrame:
             strict: Whether to operate in strict mode.
             fetch_from_url: If True and dataset has a source URL but no local file,
                           automatically fetch from URL.
-            **kwargs: Additional arguments passed to pandas.read_csv.
+            **kwargs: Additional arguments passed to pandas.read_csv. The pyarrow
+                     engine is used when SUNSTONE_FAST_IO is enabled; pass engine="c"
+                     to use the default pandas engine.
 
         Returns:
             A new Sunstone DataFrame with lineage metadata.
@@ -239,11 +719,11 @@ class DataFrame:
             >>> # Load by file path
             >>> df = DataFrame.read_csv('inputs/data.csv', project_path='/path/to/project')
         """
-        location = str(filepath_or_buffer)
+        location = os.fspath(filepath_or_buffer)
 
         # Determine if this is a slug or a file path
-        # Slugs don't contain path separators and typically use kebab-case
-        is_slug = "/" not in location and "\\" not in location and not Path(location).suffix
+        # Slugs don't contain path separators or file extensions and typically use kebab-case
+        is_slug = "/" not in location and "\\" not in location and "." not in location
 
         if is_slug:
             # Delegate to read_dataset with CSV format
@@ -260,7 +740,7 @@ class DataFrame:
         if project_path is None:
             project_path = Path.cwd()
 
-        manager = DatasetsManager(project_path)
+        manager = DatasetsManager.get(project_path)
 
         # Look up by location
         dataset = manager.find_dataset_by_location(location)
@@ -288,20 +768,21 @@ class DataFrame:
                 )
 
         # Read the CSV using pandas
-        df = pd.read_csv(absolute_path, **kwargs)
+        df = _read_csv(os.fspath(absolute_path), **kwargs)
 
         # Create lineage metadata
         lineage = LineageMetadata(project_path=str(manager.project_path))
         lineage.add_source(dataset)
 
-        # Return wrapped DataFrame
-        return cls(data=df, lineage=lineage, strict=strict, project_path=project_path)
+        # Return wrapped DataFrame; the lineage already has the resolved project path
+        return cls(data=df, lineage=lineage, strict=strict)
 
     @staticmethod
     def _get_default_strict_mode() -> bool:
-        """Get the default strict mode from environment variable."""
-        env_strict = os.environ.get("SUNSTONE_DATAFRAME_STRICT", "").lower()
-        return env_strict in ("1", "true")
+        """Get the default strict mode from set_default_strict() or the environment variable."""
+        if _default_strict is not None:
+            return _default_strict
+        return os.environ.get("SUNSTONE_DATAFRAME_STRICT", "").lower() in ("1", "true")
 
     def to_csv(
         self,
@@ -357,9 +838,20 @@ class DataFrame:
                 )
 
         # Write the CSV
-        absolute_path = manager.get_absolute_path(dataset.location)
-        absolute_path.parent.mkdir(parents=True, exist_ok=True)
-        self.data.to_csv(absolute_path, **kwargs)
+        absolute_path = os.fspath(manager.get_absolute_path(dataset.location))
+        parent = os.path.dirname(absolute_path)
+        if parent not in _known_dirs:
+            os.makedirs(parent, exist_ok=True)
+            _known_dirs.add(parent)
+        try:
+            self.data.to_csv(absolute_path, **kwargs)
+        except OSError:
+            if os.path.isdir(parent):
+                raise
+            # The directory was removed since it was created; create it again, unless
+            # another writer already has
+            os.makedirs(parent, exist_ok=True)
+            self.data.to_csv(absolute_path, **kwargs)
 
         # Compute content hash for change detection
         content_hash = compute_dataframe_hash(self.data)
@@ -376,26 +868,10 @@ class DataFrame:
         Returns:
             List of FieldSchema objects based on DataFrame columns and dtypes.
         """
-        fields = []
-        for col in self.data.columns:
-            dtype = self.data[col].dtype
-
-            # Map pandas dtypes to dataset types
-            if pd.api.types.is_integer_dtype(dtype):
-                field_type = "integer"
-            elif pd.api.types.is_float_dtype(dtype):
-                field_type = "number"
-            elif pd.api.types.is_bool_dtype(dtype):
-                field_type = "boolean"
-            elif pd.api.types.is_datetime64_any_dtype(dtype):
-                field_type = "datetime"
-            else:
-                field_type = "string"
-
-            fields.append(FieldSchema(name=str(col), type=field_type))
-
-        return fields
+        columns = tuple((str(col), dtype) for col, dtype in self.data.dtypes.items())
+        return [FieldSchema(name=name, type=field_type) for name, field_type in _infer_fields(columns)]
 
+    @_with_copy_on_write
     def merge(self, right: "DataFrame", **kwargs: Any) -> "DataFrame":
         """
         Merge with another Sunstone DataFrame, combining lineage.
@@ -413,13 +889,9 @@ class DataFrame:
         # Combine lineage (sources from both DataFrames)
         merged_lineage = self.lineage.merge(right.lineage)
 
-        return DataFrame(
-            data=merged_data,
-            lineage=merged_lineage,
-            strict=self.strict_mode,
-            project_path=self.lineage.project_path,
-        )
+        return self._derive(merged_data, merged_lineage)
 
+    @_with_copy_on_write
     def join(self, other: "DataFrame", **kwargs: Any) -> "DataFrame":
         """
         Join with another Sunstone DataFrame, combining lineage.
@@ -437,13 +909,9 @@ class DataFrame:
         # Combine lineage (sources from both DataFrames)
         joined_lineage = self.lineage.merge(other.lineage)
 
-        return DataFrame(
-            data=joined_data,
-            lineage=joined_lineage,
-            strict=self.strict_mode,
-            project_path=self.lineage.project_path,
-        )
+        return self._derive(joined_data, joined_lineage)
 
+    @_with_copy_on_write
     def concat(self, others: List["DataFrame"], **kwargs: Any) -> "DataFrame":
         """
         Concatenate with other Sunstone DataFrames, combining lineage.
@@ -455,23 +923,13 @@ class DataFrame:
         Returns:
             A new DataFrame with combined data and lineage.
         """
-        # Collect all DataFrames
-        all_dfs = [self.data] + [df.data for df in others]
-
         # Concatenate
-        concatenated_data = pd.concat(all_dfs, **kwargs)
+        concatenated_data = pd.concat([self.data, *(df.data for df in others)], **kwargs)
 
         # Combine lineage (sources from all DataFrames)
-        combined_lineage = self.lineage
-        for other in others:
-            combined_lineage = combined_lineage.merge(other.lineage)
-
-        return DataFrame(
-            data=concatenated_data,
-            lineage=combined_lineage,
-            strict=self.strict_mode,
-            project_path=self.lineage.project_path,
-        )
+        combined_lineage = functools.reduce(LineageMetadata.merge, (df.lineage for df in others), self.lineage)
+
+        return self._derive(concatenated_data, combined_lineage)
 
     def _wrap_result(self, result: Any) -> Any:
         """
@@ -483,20 +941,86 @@ class DataFrame:
         Returns:
             Wrapped DataFrame if result is a DataFrame, otherwise the result.
         """
-        if isinstance(result, pd.DataFrame):
-            new_lineage = LineageMetadata(
-                sources=self.lineage.sources.copy(),
-                project_path=self.lineage.project_path,
-            )
-
-            return DataFrame(
-                data=result,
-                lineage=new_lineage,
-                strict=self.strict_mode,
-                project_path=self.lineage.project_path,
-            )
+        if isinstance(result, pd.DataFrame) and not getattr(_lineage_state, "suspended", 0):
+            return self._derive(result)
         return result
 
+    @staticmethod
+    @contextlib.contextmanager
+    def no_lineage() -> Iterator[None]:
+        """
+        Suspend lineage wrapping of pandas results in the current thread.
+
+        Within the context, operations on Sunstone DataFrames return plain
+        pandas DataFrames, so hot loops over rows or columns run at pandas
+        speed. Wrap the final result explicitly before writing it.
+
+        Example:
+            >>> with DataFrame.no_lineage():
+            ...     counts = [df[df["region"] == r].shape[0] for r in regions]
+
+        Yields:
+            None.
+        """
+        _lineage_state.suspended = getattr(_lineage_state, "suspended", 0) + 1
+        try:
+            yield
+        finally:
+            _lineage_state.suspended -= 1
+
+    @contextlib.contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """
+        Write datasets.yaml once for all outputs written within the context.
+
+        Every to_csv() call normally rewrites datasets.yaml to register the output
+        and its lineage. Within the context, DataFrames of the same project only
+        update the registry in memory, and it is written when the context exits.
+
+        Example:
+            >>> with df.batch_writes():
+            ...     for region, group in df.groupby("region"):
+            ...         group.to_csv(f"outputs/{region}.csv", slug=region, name=region)
+
+        Yields:
+            None.
+        """
+        with self._get_datasets_manager().deferred_writes():
+            yield
+
+    def _derive(self, data: pd.DataFrame, lineage: Optional[LineageMetadata] = None) -> "DataFrame":
+        """
+        Wrap a pandas DataFrame computed from this DataFrame.
+
+        This bypasses __init__, since strict mode and the project path are inherited,
+        and defers creating the lineage until it is first accessed. The lineage is
+        snapshotted when deriving, so later changes to this DataFrame's lineage don't
+        affect the new DataFrame. Intermediate results of a chain of pandas operations
+        that are never inspected share that snapshot and cost no further bookkeeping.
+
+        Args:
+            data: The pandas DataFrame to wrap.
+            lineage: Lineage for the new DataFrame, if it was already computed
+                (e.g. combined from several DataFrames).
+
+        Returns:
+            A new DataFrame whose lineage derives from this DataFrame's lineage.
+        """
+        derived = DataFrame.__new__(DataFrame)
+        derived.data = data
+        derived.strict_mode = self.strict_mode
+        if lineage is not None:
+            derived._lineage = lineage
+            return derived
+        if self._lineage is not None:
+            # Snapshot the sources and project path, so later changes to this lineage don't leak
+            # into the derived one. derive() shares the sources list, so this is O(1).
+            derived._parent_lineage = self._lineage.derive()
+        else:
+            # Chain to the snapshot our own lineage would be created from, which nothing mutates
+            derived._parent_lineage = self._parent_lineage
+        return derived
+
     def __getattr__(self, name: str) -> Any:
         """
         Delegate attribute access to the underlying pandas DataFrame.
@@ -507,12 +1031,14 @@ class DataFrame:
         Returns:
             The attribute from the underlying DataFrame, wrapped if it's a method or DataFrame.
         """
-        # Special handling for pandas indexers - return as-is
-        if name in ("loc", "iloc", "at", "iat"):
+        if name in _INDEXERS:
             return getattr(self.data, name)
 
         attr = getattr(self.data, name)
 
+        if name in _PASSTHROUGH_SCALARS:
+            return attr
+
         if callable(attr):
 
             def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -521,7 +1047,7 @@ class DataFrame:
 
             return wrapper
 
-        return self._wrap_result(attr)
+        return self._wrap_result(attr) if isinstance(attr, pd.DataFrame) else attr
 
     def __getitem__(self, key: Any) -> Any:
         """
@@ -534,8 +1060,14 @@ class DataFrame:
             The item from the underlying DataFrame, wrapped if it's a DataFrame.
         """
         result = self.data[key]
-        return self._wrap_result(result)
+        if result.__class__ is pd.Series:
+            # Single-column access is the common case and never needs lineage
+            return result
+        if isinstance(result, pd.DataFrame) and not getattr(_lineage_state, "suspended", 0):
+            return self._derive(result)
+        return result
 
+    @_with_copy_on_write
     def __setitem__(self, key: Any, value: Any) -> None:
         """
         Delegate item assignment to the underlying pandas DataFrame.
@@ -550,7 +1082,10 @@ class DataFrame:
 
     def __repr__(self) -> str:
         """String representation of the DataFrame."""
-        lineage_info = f"\n\nLineage: {len(self.lineage.sources)} source(s)"
+        # Count the sources without creating the lineage of a derived DataFrame
+        lineage = self._lineage if self._lineage is not None else self._parent_lineage
+        source_count = len(lineage.sources) if lineage is not None else 0
+        lineage_info = f"\n\nLineage: {source_count} source(s)"
         return repr(self.data) + lineage_info
 
     def __str__(self) -> str:
@@ -564,3 +1099,22 @@ class DataFrame:
     def __iter__(self) -> Any:
         """Iterate over column names."""
         return iter(self.data)
+
+
+def _install_delegates() -> None:
+    """
+    Add delegates for the public pandas DataFrame methods and properties to DataFrame.
+
+    They are installed once when the module is imported, so accessing them bypasses
+    __getattr__ and doesn't allocate a closure, and the class's attributes don't
+    depend on which ones have been used. Attributes DataFrame defines itself are kept.
+    """
+    for name in dir(pd.DataFrame):
+        if name in _INDEXERS or hasattr(DataFrame, name):
+            continue
+        delegate = _make_delegate(name)
+        if delegate is not None:
+            setattr(DataFrame, name, delegate)
+
+
+_install_delegates()
@@ -3,6 +3,7 @@ Lineage metadata structures for tracking data provenance.
 """
 
 import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -10,8 +11,14 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 if TYPE_CHECKING:
     import pandas as pd
 
+# orjson serializes lineage faster than the standard library when it is installed
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - orjson is optional
+    _orjson = None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SourceLocation:
     """Location information for a data source."""
 
@@ -25,7 +32,7 @@ class SourceLocation:
     """URL to a page describing the data source."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Source:
     """Source attribution information for a dataset."""
 
@@ -52,7 +59,7 @@ class Source:
     """Optional description of update frequency."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FieldSchema:
     """Schema definition for a dataset field."""
 
@@ -66,7 +73,7 @@ class FieldSchema:
     """Optional constraints (e.g., enum values)."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatasetMetadata:
     """Metadata for a dataset from datasets.yaml."""
 
@@ -92,11 +99,29 @@ class DatasetMetadata:
     """Type of dataset: 'input' or 'output'."""
 
 
+class _DigestWriter:
+    """File-like object that feeds everything written to it into a hash."""
+
+    __slots__ = ("write",)
+
+    def __init__(self, digest: "hashlib._Hash") -> None:
+        self.write = digest.update
+
+
 def compute_dataframe_hash(df: "pd.DataFrame") -> str:
     """
     Compute a fast SHA256 hash of a pandas DataFrame's content.
 
-    Uses pickle serialization for a consistent, fast representation of the data.
+    Rows are hashed with pandas' vectorized hash_pandas_object, and the digest
+    covers those row hashes together with the column names and dtypes, so the
+    DataFrame is never serialized as a whole. DataFrames with unhashable values
+    (e.g. lists in object columns) fall back to hashing their pickle, which is
+    streamed into the hash rather than built in memory.
+
+    hash_pandas_object hashes the values of object columns through their string
+    form, so the inferred type of each object column (e.g. 'integer' or 'string')
+    is hashed too, and [1] and ["1"] hash differently. Columns mixing types are
+    only told apart by their values' string forms, so [1, "1"] and ["1", 1] collide.
 
     Args:
         df: The pandas DataFrame to hash.
@@ -104,14 +129,26 @@ def compute_dataframe_hash(df: "pd.DataFrame") -> str:
     Returns:
         A SHA256 hex digest string representing the DataFrame content.
     """
-    import pickle
+    import pandas as pd
+
+    dtypes = [
+        f"{dtype}:{pd.api.types.infer_dtype(df.iloc[:, i], skipna=False)}" if dtype.kind == "O" else str(dtype)
+        for i, dtype in enumerate(df.dtypes)
+    ]
+    digest = hashlib.sha256(repr((list(df.columns), dtypes)).encode())
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True)
+    except TypeError:
+        import pickle
 
-    # Use pickle protocol 5 for efficiency; hash the bytes directly
-    data_bytes = pickle.dumps(df, protocol=5)
-    return hashlib.sha256(data_bytes).hexdigest()
+        # Stream the pickle into the digest frame by frame instead of building it in memory
+        pickle.dump(df, _DigestWriter(digest), protocol=5)
+    else:
+        digest.update(row_hashes.to_numpy())
+    return digest.hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class LineageMetadata:
     """
     Lineage metadata tracking the provenance of data in a DataFrame.
@@ -120,7 +157,10 @@ class LineageMetadata:
     """
 
     sources: List[DatasetMetadata] = field(default_factory=list)
-    """List of source datasets that contributed to this data."""
+    """List of source datasets that contributed to this data.
+
+    The list may be shared with derived lineages; use add_source() rather than
+    mutating it in place."""
 
     created_at: Optional[datetime] = None
     """Timestamp when this lineage was last updated (content changed)."""
@@ -131,14 +171,39 @@ class LineageMetadata:
     project_path: Optional[str] = None
     """Path to the project directory containing datasets.yaml."""
 
+    _shared_sources: bool = field(default=False, init=False, repr=False, compare=False)
+    """Whether the sources list is shared with another lineage (copy before mutating)."""
+
+    def derive(self) -> "LineageMetadata":
+        """
+        Create lineage for data derived from this lineage's DataFrame.
+
+        The sources list is shared instead of copied, so deriving is O(1) however
+        many sources have accumulated; whichever lineage adds a source first takes
+        its own copy of the list.
+
+        Returns:
+            A new LineageMetadata with the same sources and project path.
+        """
+        self._shared_sources = True
+        derived = LineageMetadata(sources=self.sources, project_path=self.project_path)
+        derived._shared_sources = True
+        return derived
+
     def add_source(self, dataset: DatasetMetadata) -> None:
         """
         Add a source dataset to the lineage.
 
+        Sources are identified by slug; a dataset whose slug is already among the
+        sources is not added again.
+
         Args:
             dataset: The dataset metadata to add to sources.
         """
-        if dataset not in self.sources:
+        if all(source.slug != dataset.slug for source in self.sources):
+            if self._shared_sources:
+                self.sources = self.sources.copy()
+                self._shared_sources = False
             self.sources.append(dataset)
 
     def merge(self, other: "LineageMetadata") -> "LineageMetadata":
@@ -151,14 +216,27 @@ class LineageMetadata:
         Returns:
             A new LineageMetadata with combined sources.
         """
-        merged = LineageMetadata(
-            sources=self.sources.copy(),
-            project_path=self.project_path or other.project_path,
-        )
-
-        # Add sources from other that aren't already present
+        project_path = self.project_path or other.project_path
+
+        # Self-joins and concats of DataFrames derived from the same parent share one
+        # sources list; there is nothing to combine, so share it instead of re-walking it.
+        if other.sources is self.sources or not other.sources:
+            merged = self.derive()
+            merged.project_path = project_path
+            return merged
+        if not self.sources:
+            merged = other.derive()
+            merged.project_path = project_path
+            return merged
+
+        merged = LineageMetadata(sources=self.sources.copy(), project_path=project_path)
+
+        # Add sources from other that aren't already present, keyed by slug so that
+        # merging K and M sources is O(K + M) rather than comparing every pair
+        seen = {source.slug for source in self.sources}
         for source in other.sources:
-            if source not in merged.sources:
+            if source.slug not in seen:
+                seen.add(source.slug)
                 merged.sources.append(source)
 
         return merged
@@ -170,11 +248,7 @@ class LineageMetadata:
         Returns:
             List of unique license identifiers.
         """
-        licenses = set()
-        for source in self.sources:
-            if source.source and source.source.license:
-                licenses.add(source.source.license)
-        return sorted(licenses)
+        return sorted({src.source.license for src in self.sources if src.source and src.source.license})
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -198,3 +272,19 @@ class LineageMetadata:
         if self.content_hash is not None:
             result["content_hash"] = self.content_hash
         return result
+
+    def to_json(self) -> str:
+        """
+        Convert lineage metadata to a compact JSON string.
+
+        Uses orjson when it is installed and the standard library otherwise;
+        both produce the same output.
+
+        Returns:
+            JSON representation of to_dict().
+        """
+        data = self.to_dict()
+        if _orjson is not None:
+            encoded: bytes = _orjson.dumps(data)
+            return encoded.decode()
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
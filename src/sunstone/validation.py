@@ -5,10 +5,65 @@ This module provides tools to validate that notebooks and scripts are
 correctly using Sunstone's lineage tracking features.
 """
 
+import asyncio
+import functools
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+# Import statements, matched line by line ([^\S\n] is whitespace other than a newline).
+# Each match is tagged by the group that matched: plain pandas imports, sunstone.pandas
+# imports, and general sunstone imports. A "from sunstone import pandas" import is a
+# sunstone import whose from_sunstone_pandas group is set. Matches start at the beginning
+# of a line, so commented-out imports never match.
+_IMPORT_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<plain_pandas>import[^\S\n]+pandas(?:[^\S\n]+as[^\S\n]+pd)?[^\S\n]*$|from[^\S\n]+pandas[^\S\n]+import[^\S\n])"
+    r"|(?P<sunstone_pandas>import[^\S\n]+sunstone\.pandas[^\S\n]+as[^\S\n]+pd[^\S\n]*$)"
+    r"|(?P<sunstone>import[^\S\n]+sunstone(?:[^\S\n]*$|[^\S\n]+as[^\S\n])"
+    r"|from[^\S\n]+sunstone[^\S\n]+import[^\S\n]"
+    r"(?P<from_sunstone_pandas>[^\S\n]*pandas(?:[^\S\n]+as[^\S\n]+pd)?[^\S\n]*$)?)"
+    r")",
+    re.MULTILINE,
+)
+
+
+# Projects with fewer notebooks are checked serially, as a thread pool wouldn't pay off
+_MIN_PARALLEL_NOTEBOOKS = 4
+
+# The pattern validate_project_notebooks finds with a pruned directory walk
+_DEFAULT_NOTEBOOK_PATTERN = "**/*.ipynb"
+
+# Directories that never hold project notebooks, so the walk doesn't descend into them
+_SKIPPED_DIRS = frozenset({".ipynb_checkpoints", ".git", "__pycache__", "node_modules"})
+
+# orjson parses notebooks faster than the standard library when it is installed
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - orjson is optional
+    _orjson = None
+
+
+def _load_notebook(notebook_path: Path) -> Any:
+    """
+    Parse a notebook's JSON.
+
+    Args:
+        notebook_path: Path to the Jupyter notebook.
+
+    Returns:
+        The parsed notebook.
+
+    Raises:
+        json.JSONDecodeError: If the notebook isn't valid JSON (orjson's error is a subclass).
+    """
+    if _orjson is not None:
+        return _orjson.loads(notebook_path.read_bytes())
+    with open(notebook_path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
 class ImportCheckResult:
@@ -18,6 +73,8 @@ class ImportCheckResult:
         self.has_plain_pandas = False
         self.has_sunstone_pandas = False
         self.has_sunstone = False
+        # Set when a fast check stopped at the first plain pandas import, so later imports weren't seen
+        self.stopped_early = False
         self.plain_pandas_locations: List[str] = []
         self.warnings: List[str] = []
         self.errors: List[str] = []
@@ -27,6 +84,18 @@ class ImportCheckResult:
         """Whether the file has valid imports (uses sunstone, not plain pandas)."""
         return not self.has_plain_pandas and (self.has_sunstone or self.has_sunstone_pandas)
 
+    def _copy(self) -> "ImportCheckResult":
+        """Copy the result, so that callers can't modify a cached result."""
+        result = ImportCheckResult()
+        result.has_plain_pandas = self.has_plain_pandas
+        result.has_sunstone_pandas = self.has_sunstone_pandas
+        result.has_sunstone = self.has_sunstone
+        result.stopped_early = self.stopped_early
+        result.plain_pandas_locations = list(self.plain_pandas_locations)
+        result.warnings = list(self.warnings)
+        result.errors = list(self.errors)
+        return result
+
     def add_warning(self, message: str) -> None:
         """Add a warning message."""
         self.warnings.append(message)
@@ -58,7 +127,8 @@ class ImportCheckResult:
                 lines.append("    # or")
                 lines.append("    import sunstone.pandas as pd")
 
-            if not self.has_sunstone and not self.has_sunstone_pandas:
+            # A fast check that stopped early may have missed sunstone imports after the pandas import
+            if not self.has_sunstone and not self.has_sunstone_pandas and not self.stopped_early:
                 lines.append("\n  Problem: No sunstone imports found")
                 lines.append("\n  Solution: Add sunstone import:")
                 lines.append("    from sunstone import pandas as pd")
@@ -76,7 +146,7 @@ class ImportCheckResult:
         return "\n".join(lines)
 
 
-def check_notebook_imports(notebook_path: Union[str, Path]) -> ImportCheckResult:
+def check_notebook_imports(notebook_path: Union[str, Path], fast: bool = False) -> ImportCheckResult:
     """
     Check a Jupyter notebook for correct Sunstone import usage.
 
@@ -85,8 +155,12 @@ def check_notebook_imports(notebook_path: Union[str, Path]) -> ImportCheckResult
     2. Sunstone's pandas module is imported (from sunstone import pandas as pd)
     3. Sunstone is imported (import sunstone)
 
+    Results are cached, so checking a notebook again is cheap until it is modified.
+
     Args:
         notebook_path: Path to the Jupyter notebook (.ipynb file).
+        fast: If True, stop at the first plain pandas import, which decides that
+              the check fails. Only that import's location is reported.
 
     Returns:
         ImportCheckResult with details about the imports found.
@@ -97,16 +171,53 @@ def check_notebook_imports(notebook_path: Union[str, Path]) -> ImportCheckResult
         >>> if not result.is_valid:
         ...     print(result.summary())
     """
-    result = ImportCheckResult()
     notebook_path = Path(notebook_path)
 
+    try:
+        st = notebook_path.stat()
+    except OSError:
+        return _check_notebook(notebook_path, fast)
+
+    # Unchanged notebooks are only checked once per process
+    return _check_notebook_cached(os.path.abspath(notebook_path), st.st_mtime_ns, st.st_size, fast)._copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _check_notebook_cached(notebook_path: str, mtime_ns: int, size: int, fast: bool) -> ImportCheckResult:
+    """
+    Check a notebook, caching the result by the notebook's path, modification time and size.
+
+    Args:
+        notebook_path: Absolute path to the Jupyter notebook.
+        mtime_ns: Modification time of the notebook, in nanoseconds.
+        size: Size of the notebook, in bytes.
+        fast: If True, stop at the first plain pandas import.
+
+    Returns:
+        The cached ImportCheckResult, which must not be modified.
+    """
+    return _check_notebook(Path(notebook_path), fast)
+
+
+def _check_notebook(notebook_path: Path, fast: bool) -> ImportCheckResult:
+    """
+    Check a notebook for correct Sunstone import usage.
+
+    Args:
+        notebook_path: Path to the Jupyter notebook.
+        fast: If True, stop at the first plain pandas import.
+
+    Returns:
+        ImportCheckResult with details about the imports found.
+    """
+    result = ImportCheckResult()
+
     if not notebook_path.exists():
         result.add_error(f"Notebook not found: {notebook_path}")
         return result
 
     try:
-        with open(notebook_path, "r", encoding="utf-8") as f:
-            notebook = json.load(f)
+        notebook = _load_notebook(notebook_path)
     except json.JSONDecodeError as e:
         result.add_error(f"Invalid JSON in notebook: {e}")
         return result
@@ -126,17 +237,21 @@ def check_notebook_imports(notebook_path: Union[str, Path]) -> ImportCheckResult
             source = "".join(source)
 
         # Check for various import patterns
-        _check_source_imports(source, result, f"Cell {i + 1}")
+        _check_source_imports(source, result, f"Cell {i + 1}", fast)
+        if fast and result.has_plain_pandas:
+            break
 
     return result
 
 
-def check_script_imports(script_path: Union[str, Path]) -> ImportCheckResult:
+def check_script_imports(script_path: Union[str, Path], fast: bool = False) -> ImportCheckResult:
     """
     Check a Python script for correct Sunstone import usage.
 
     Args:
         script_path: Path to the Python script (.py file).
+        fast: If True, stop at the first plain pandas import, which decides that
+              the check fails. Only that import's location is reported.
 
     Returns:
         ImportCheckResult with details about the imports found.
@@ -161,11 +276,11 @@ def check_script_imports(script_path: Union[str, Path]) -> ImportCheckResult:
         result.add_error(f"Error reading script: {e}")
         return result
 
-    _check_source_imports(source, result, str(script_path.name))
+    _check_source_imports(source, result, str(script_path.name), fast)
     return result
 
 
-def _check_source_imports(source: str, result: ImportCheckResult, location: str) -> None:
+def _check_source_imports(source: str, result: ImportCheckResult, location: str, fast: bool = False) -> None:
     """
     Check source code for import statements.
 
@@ -173,60 +288,95 @@ def _check_source_imports(source: str, result: ImportCheckResult, location: str)
         source: Source code to check.
         result: ImportCheckResult to update.
         location: Description of where this source came from.
+        fast: If True, stop at the first plain pandas import.
+    """
+    line_num = 1
+    line_start = 0
+    for match in _IMPORT_RE.finditer(source):
+        kind = match.lastgroup
+        if kind == "plain_pandas":
+            # Plain pandas (bad); only its locations need line numbers
+            line_num += source.count("\n", line_start, match.start())
+            line_start = match.start()
+            result.has_plain_pandas = True
+            result.plain_pandas_locations.append(f"{location}:{line_num}")
+            if fast:
+                # No later import can make the check pass
+                result.stopped_early = True
+                return
+        elif kind == "sunstone_pandas":
+            # sunstone.pandas (good)
+            result.has_sunstone_pandas = True
+        else:
+            # General sunstone import (good), which may import sunstone's pandas module
+            result.has_sunstone = True
+            if match.group("from_sunstone_pandas"):
+                result.has_sunstone_pandas = True
+
+
+def _iter_notebooks(root: Path) -> Iterator[Path]:
     """
-    # Pattern for plain pandas import
-    plain_pandas_patterns = [
-        r"^\s*import\s+pandas\s+as\s+pd\s*$",
-        r"^\s*import\s+pandas\s*$",
-        r"^\s*from\s+pandas\s+import\s+",
-    ]
-
-    # Pattern for sunstone.pandas import
-    sunstone_pandas_patterns = [
-        r"^\s*from\s+sunstone\s+import\s+pandas\s+as\s+pd\s*$",
-        r"^\s*import\s+sunstone\.pandas\s+as\s+pd\s*$",
-        r"^\s*from\s+sunstone\s+import\s+pandas\s*$",
-    ]
-
-    # Pattern for general sunstone import
-    sunstone_patterns = [
-        r"^\s*import\s+sunstone\s*$",
-        r"^\s*import\s+sunstone\s+as\s+",
-        r"^\s*from\s+sunstone\s+import\s+",
-    ]
-
-    # Check each line
-    for line_num, line in enumerate(source.split("\n"), 1):
-        # Skip comments
-        if line.strip().startswith("#"):
+    Find the notebooks below a directory, without descending into skipped directories.
+
+    Args:
+        root: Directory to search.
+
+    Yields:
+        Path of each notebook found.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
             continue
+        with entries:
+            for entry in entries:
+                if entry.name in _SKIPPED_DIRS:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".ipynb"):
+                    yield Path(entry.path)
 
-        # Check for plain pandas (bad)
-        for pattern in plain_pandas_patterns:
-            if re.match(pattern, line, re.MULTILINE):
-                result.has_plain_pandas = True
-                result.plain_pandas_locations.append(f"{location}:{line_num}")
 
-        # Check for sunstone.pandas (good)
-        for pattern in sunstone_pandas_patterns:
-            if re.match(pattern, line, re.MULTILINE):
-                result.has_sunstone_pandas = True
+def _find_notebooks(project_path: Path, pattern: str) -> List[Path]:
+    """
+    Find the notebooks of a project.
 
-        # Check for general sunstone import (good)
-        for pattern in sunstone_patterns:
-            if re.match(pattern, line, re.MULTILINE):
-                result.has_sunstone = True
+    Args:
+        project_path: Path to the project directory.
+        pattern: Glob pattern for finding notebooks.
+
+    Returns:
+        Paths of the notebooks found, excluding checkpoints.
+    """
+    if pattern == _DEFAULT_NOTEBOOK_PATTERN:
+        return list(_iter_notebooks(project_path))
+    # Skip .ipynb_checkpoints
+    return [path for path in project_path.glob(pattern) if ".ipynb_checkpoints" not in str(path)]
 
 
 def validate_project_notebooks(
-    project_path: Union[str, Path], pattern: str = "**/*.ipynb"
+    project_path: Union[str, Path],
+    pattern: str = _DEFAULT_NOTEBOOK_PATTERN,
+    fast: bool = False,
+    max_workers: Optional[int] = None,
 ) -> Dict[str, ImportCheckResult]:
     """
     Validate all notebooks in a project directory.
 
+    Notebooks are read and checked concurrently in a thread pool, since reading
+    them from disk dominates for large projects.
+
     Args:
         project_path: Path to the project directory.
-        pattern: Glob pattern for finding notebooks (default: **/*.ipynb).
+        pattern: Glob pattern for finding notebooks (default: **/*.ipynb). The default
+                 pattern is matched by a directory walk that skips .git, __pycache__
+                 and node_modules directories; other patterns are globbed.
+        fast: If True, stop checking each notebook at its first plain pandas import.
+        max_workers: Maximum number of notebooks checked at once (default: chosen
+                     by ThreadPoolExecutor).
 
     Returns:
         Dictionary mapping notebook paths to their ImportCheckResults.
@@ -240,14 +390,44 @@ def validate_project_notebooks(
         ...         print(result.summary())
     """
     project_path = Path(project_path)
-    results = {}
+    notebook_paths = _find_notebooks(project_path, pattern)
 
-    for notebook_path in project_path.glob(pattern):
-        # Skip .ipynb_checkpoints
-        if ".ipynb_checkpoints" in str(notebook_path):
-            continue
+    if len(notebook_paths) < _MIN_PARALLEL_NOTEBOOKS:
+        checked = [check_notebook_imports(path, fast) for path in notebook_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checked = list(executor.map(lambda path: check_notebook_imports(path, fast), notebook_paths))
+
+    return {str(path.relative_to(project_path)): result for path, result in zip(notebook_paths, checked)}
+
+
+async def validate_project_notebooks_async(
+    project_path: Union[str, Path],
+    pattern: str = _DEFAULT_NOTEBOOK_PATTERN,
+    fast: bool = False,
+) -> Dict[str, ImportCheckResult]:
+    """
+    Validate all notebooks in a project directory without blocking the event loop.
+
+    This is the coroutine version of validate_project_notebooks, for use in
+    asynchronous applications such as Jupyter server extensions. Notebooks are
+    found, read and checked in worker threads.
+
+    Args:
+        project_path: Path to the project directory.
+        pattern: Glob pattern for finding notebooks (default: **/*.ipynb).
+        fast: If True, stop checking each notebook at its first plain pandas import.
+
+    Returns:
+        Dictionary mapping notebook paths to their ImportCheckResults.
+
+    Example:
+        >>> from sunstone.validation import validate_project_notebooks_async
+        >>> results = await validate_project_notebooks_async('/path/to/project')
+    """
+    project_path = Path(project_path)
+    notebook_paths = await asyncio.to_thread(_find_notebooks, project_path, pattern)
 
-        result = check_notebook_imports(notebook_path)
-        results[str(notebook_path.relative_to(project_path))] = result
+    checked = await asyncio.gather(*(asyncio.to_thread(check_notebook_imports, path, fast) for path in notebook_paths))
 
-    return results
+    return {str(path.relative_to(project_path)): result for path, result in zip(notebook_paths, checked)}
@@ -3,9 +3,15 @@ Pytest configuration and fixtures for Sunstone library tests.
 """
 
 from pathlib import Path
+from typing import Callable, Optional
 
 import pytest
 
+import sunstone
+
+# Location of the UN member states input dataset in the test project
+UN_MEMBERS_LOCATION = "inputs/official_un_member_states_raw.csv"
+
 
 @pytest.fixture(scope="session")
 def project_path() -> Path:
@@ -17,3 +23,44 @@ def project_path() -> Path:
 def datasets_yaml_path(project_path: Path) -> Path:
     """Path to datasets.yaml file."""
     return project_path / "datasets.yaml"
+
+
+@pytest.fixture(scope="module")
+def datasets_manager(project_path: Path) -> "sunstone.DatasetsManager":
+    """DatasetsManager for the test project, shared by the tests of a module."""
+    return sunstone.DatasetsManager(project_path)
+
+
+@pytest.fixture
+def un_dataset(datasets_manager: "sunstone.DatasetsManager") -> sunstone.DatasetMetadata:
+    """
+    The UN member states dataset of the shared DatasetsManager.
+
+    The manager returns a copy, so tests may change it without affecting others.
+    """
+    dataset = datasets_manager.find_dataset_by_slug("official-un-member-states")
+    assert dataset is not None and dataset.source is not None
+    return dataset
+
+
+@pytest.fixture(scope="session")
+def un_members_read(project_path: Path) -> "sunstone.DataFrame":
+    """The UN member states input dataset, read with DataFrame.read_csv once per test session."""
+    return sunstone.DataFrame.read_csv(UN_MEMBERS_LOCATION, project_path=project_path, strict=False)
+
+
+@pytest.fixture
+def read_un_members(un_members_read: "sunstone.DataFrame") -> Callable[[Optional[bool]], "sunstone.DataFrame"]:
+    """
+    Factory for Sunstone DataFrames of the UN member states input dataset.
+
+    Each DataFrame copies the data and lineage of one DataFrame.read_csv result,
+    so the CSV file is only parsed once and tests may modify what they get.
+    """
+
+    def read(strict: Optional[bool] = False) -> "sunstone.DataFrame":
+        return sunstone.DataFrame(
+            data=un_members_read.data.copy(), lineage=un_members_read.lineage.derive(), strict=strict
+        )
+
+    return read
@@ -2,37 +2,102 @@
 Tests for Sunstone DataFrame functionality.
 """
 
+import os
+import shutil
+import unittest.mock
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict
 
+import pandas as pd
 import pytest
+from ruamel.yaml import YAML
 
 import sunstone
 
 
+def _overlay_project(src: Path, dst: Path) -> None:
+    """
+    Create a writable copy of a project without copying its input files.
+
+    Only datasets.yaml is copied and outputs/ is created empty; everything else
+    is symlinked to the original, falling back to copies where symlinks aren't
+    supported (e.g. on Windows without developer mode).
+    """
+    dst.mkdir()
+    for entry in src.iterdir():
+        target = dst / entry.name
+        if entry.name == "datasets.yaml":
+            shutil.copy2(entry, target)
+        elif entry.name == "outputs":
+            target.mkdir()
+        else:
+            try:
+                os.symlink(entry, target, target_is_directory=entry.is_dir())
+            except OSError:
+                if entry.is_dir():
+                    shutil.copytree(entry, target)
+                else:
+                    shutil.copy2(entry, target)
+
+
+def _load_outputs(project: Path) -> Dict[str, Any]:
+    """Load the outputs registered in a project's datasets.yaml, by slug."""
+    with open(project / "datasets.yaml") as f:
+        data = YAML(typ="safe").load(f)
+    return {output["slug"]: output for output in data.get("outputs") or []}
+
+
 class TestDataFrameBasics:
     """Tests for basic DataFrame operations."""
 
-    def test_read_csv(self, project_path: Path) -> None:
-        """Test reading a CSV file into a DataFrame."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv",
-            project_path=project_path,
-            strict=False,
-        )
+    @pytest.mark.parametrize(
+        "read",
+        [
+            pytest.param(
+                lambda project_path: sunstone.DataFrame.read_csv(
+                    "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False
+                ),
+                id="read_csv",
+            ),
+            pytest.param(
+                lambda project_path: sunstone.DataFrame.read_csv(
+                    "official-un-member-states", project_path=project_path, strict=False
+                ),
+                id="read_csv_by_slug",
+            ),
+            pytest.param(
+                lambda project_path: sunstone.DataFrame.read_dataset(
+                    "official-un-member-states", project_path=project_path, strict=False
+                ),
+                id="read_dataset",
+            ),
+            pytest.param(
+                lambda project_path: sunstone.DataFrame.read_dataset(
+                    "official-un-member-states", project_path=project_path, format="csv", strict=False
+                ),
+                id="read_dataset_explicit_format",
+            ),
+            pytest.param(
+                lambda project_path: sunstone.pandas.read_dataset(
+                    "official-un-member-states", project_path=project_path
+                ),
+                id="pandas_read_dataset",
+            ),
+        ],
+    )
+    def test_read(self, project_path: Path, read: Callable[[Path], sunstone.DataFrame]) -> None:
+        """Test that each way of reading a dataset returns its data with the dataset as lineage source."""
+        df = read(project_path)
 
-        assert df is not None
+        assert isinstance(df, sunstone.DataFrame)
         assert len(df.data) > 0
         assert len(df.data.columns) > 0
-        assert len(df.lineage.sources) > 0
+        assert [source.slug for source in df.lineage.sources] == ["official-un-member-states"]
 
-    def test_head_preserves_lineage(self, project_path: Path) -> None:
+    def test_head_preserves_lineage(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
         """Test that head() preserves lineage."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv",
-            project_path=project_path,
-            strict=False,
-        )
+        df = read_un_members()
 
         filtered = df.head(10)
 
@@ -54,31 +119,121 @@ class TestDataFrameBasics:
         assert len(members1.lineage.sources) > 0
         assert len(members2.lineage.sources) > 0
 
+    def test_read_csv_forwards_usecols(self, project_path: Path) -> None:
+        """Test that column selection is passed through to the CSV parser."""
+        columns = ["Member State", "ISO Code", "Start date"]
+
+        df = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False, usecols=columns
+        )
+
+        assert list(df.data.columns) == columns
+        assert [source.slug for source in df.lineage.sources] == ["official-un-member-states"]
+
+    def test_read_csv_falls_back_from_pyarrow_engine(self, project_path: Path, monkeypatch: Any) -> None:
+        """Test that options unsupported by the pyarrow engine fall back to the default engine."""
+        import sunstone.dataframe
+
+        read_csv = pd.read_csv
+        engines = []
+
+        def fake_read_csv(path: Any, **kwargs: Any) -> Any:
+            engines.append(kwargs.get("engine"))
+            if kwargs.get("engine") == "pyarrow":
+                raise ValueError("The 'nrows' option is not supported with the 'pyarrow' engine")
+            return read_csv(path, **kwargs)
+
+        monkeypatch.setattr(sunstone.dataframe, "_HAS_PYARROW", True)
+        monkeypatch.setenv("SUNSTONE_FAST_IO", "1")
+        monkeypatch.setattr(pd, "read_csv", fake_read_csv)
+
+        df = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False, nrows=3
+        )
+
+        assert engines == ["pyarrow", None]
+        assert len(df) == 3
+
+    def test_read_csv_pyarrow_engine_is_opt_in(self, project_path: Path, monkeypatch: Any) -> None:
+        """Test that the pyarrow engine is only used with SUNSTONE_FAST_IO, and data errors aren't retried."""
+        import sunstone.dataframe
+
+        engines = []
+
+        def fake_read_csv(path: Any, **kwargs: Any) -> Any:
+            engines.append(kwargs.get("engine"))
+            raise ValueError("CSV parse error: Expected 3 columns, got 2")
+
+        monkeypatch.setattr(sunstone.dataframe, "_HAS_PYARROW", True)
+        monkeypatch.setattr(pd, "read_csv", fake_read_csv)
+
+        with pytest.raises(ValueError, match="CSV parse error"):
+            sunstone.dataframe._read_csv(project_path / "inputs/official_un_member_states_raw.csv")
+        monkeypatch.setenv("SUNSTONE_FAST_IO", "1")
+        with pytest.raises(ValueError, match="CSV parse error"):
+            sunstone.dataframe._read_csv(project_path / "inputs/official_un_member_states_raw.csv")
+
+        assert engines == [None, "pyarrow"]
+
+    def test_read_csv_pyarrow_engine(self, project_path: Path, monkeypatch: Any) -> None:
+        """Test that SUNSTONE_FAST_IO reads CSV files with pyarrow to the same rows and columns."""
+        pytest.importorskip("pyarrow")
+
+        default = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False
+        )
+        monkeypatch.setenv("SUNSTONE_FAST_IO", "1")
+        fast = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False
+        )
+
+        assert fast.data.shape == default.data.shape
+        assert list(fast.data.columns) == list(default.data.columns)
+        assert fast.lineage.sources == default.lineage.sources
+
+    def test_read_parquet_fast_io(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test that SUNSTONE_FAST_IO reads Parquet files with pyarrow to the same data."""
+        pytest.importorskip("pyarrow")
+        from sunstone.dataframe import _read_parquet
+
+        path = tmp_path / "data.parquet"
+        expected = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        expected.to_parquet(path)
+
+        monkeypatch.setenv("SUNSTONE_FAST_IO", "1")
+        pd.testing.assert_frame_equal(_read_parquet(path), expected)
+        pd.testing.assert_frame_equal(_read_parquet(path, columns=["b"]), expected[["b"]])
+
+    def test_relative_project_path_follows_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that relative project paths resolve against the current directory."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        assert sunstone.DataFrame({"a": [1]}, project_path=".").lineage.project_path == str(first.resolve())
+
+        monkeypatch.chdir(second)
+        assert sunstone.DataFrame({"a": [1]}, project_path=".").lineage.project_path == str(second.resolve())
+
 
 class TestDataFrameMerge:
     """Tests for DataFrame merge operations."""
 
     @pytest.fixture
-    def un_members_df1(self, project_path: Path) -> Any:
+    def un_members_df1(self, read_un_members: Callable[..., sunstone.DataFrame]) -> Any:
         """Load UN members DataFrame (first instance)."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv",
-            project_path=project_path,
-            strict=False,
-        )
+        df = read_un_members()
         # Filter to create a subset
         return df[df.data["ISO Code"].notna()].head(50)
 
     @pytest.fixture
-    def un_members_df2(self, project_path: Path) -> Any:
+    def un_members_df2(self, read_un_members: Callable[..., sunstone.DataFrame]) -> Any:
         """Load UN members DataFrame (second instance)."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv",
-            project_path=project_path,
-            strict=False,
-        )
-        # Select different columns as a second dataset
-        return df[["Member State", "ISO Code", "Start date"]].dropna()
+        df = read_un_members()
+        # Select different columns as a second dataset, kept small like the first
+        return df[["Member State", "ISO Code", "Start date"]].dropna().head(100)
 
     def test_merge_dataframes(self, un_members_df1: Any, un_members_df2: Any) -> None:
         """Test merging two DataFrames."""
@@ -102,13 +257,9 @@ class TestLineageMetadata:
     """Tests for lineage metadata functionality."""
 
     @pytest.fixture
-    def processed_df(self, project_path: Path) -> Any:
+    def processed_df(self, read_un_members: Callable[..., sunstone.DataFrame]) -> Any:
         """Create a processed DataFrame for testing."""
-        un_members = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv",
-            project_path=project_path,
-            strict=False,
-        )
+        un_members = read_un_members()
         # Apply some operations
         filtered = un_members[un_members.data["ISO Code"].notna()]
         return filtered.head(100)
@@ -122,58 +273,71 @@ class TestLineageMetadata:
         # created_at is only set when writing output (not when reading)
         assert len(lineage_dict["sources"]) > 0
 
+    def test_derived_lineage_shares_sources(self, processed_df: Any) -> None:
+        """Test that derived DataFrames share sources until one adds a source."""
+        derived = processed_df.head(10)
+        assert derived.lineage.sources is processed_df.lineage.sources
 
-class TestStrictMode:
-    """Tests for strict mode functionality."""
+        extra = sunstone.DatasetMetadata(name="Extra", slug="extra", location="inputs/extra.csv", fields=[])
+        derived.lineage.add_source(extra)
 
-    def test_strict_mode_load(self, project_path: Path, monkeypatch: Any) -> None:
-        """Test loading DataFrame in strict mode."""
-        monkeypatch.setenv("SUNSTONE_DATAFRAME_STRICT", "1")
+        assert extra in derived.lineage.sources
+        assert extra not in processed_df.lineage.sources
+        assert len(derived.lineage.sources) == len(processed_df.lineage.sources) + 1
 
-        strict_df = sunstone.DataFrame.read_csv("inputs/official_un_member_states_raw.csv", project_path=project_path)
+    def test_parent_changes_after_derive_do_not_leak(self, processed_df: Any) -> None:
+        """Test that sources and project path changed on a parent after deriving don't reach the child."""
+        source_count = len(processed_df.lineage.sources)
+        project_path = processed_df.lineage.project_path
+        derived = processed_df.head(10)
+        grandchild = derived.head(5)
 
-        assert strict_df.strict_mode is True
+        extra = sunstone.DatasetMetadata(name="Extra", slug="extra", location="inputs/extra.csv", fields=[])
+        processed_df.lineage.add_source(extra)
+        processed_df.lineage.project_path = "/elsewhere"
+
+        for child in (derived, grandchild):
+            assert extra not in child.lineage.sources
+            assert len(child.lineage.sources) == source_count
+            assert child.lineage.project_path == project_path
 
-    def test_strict_mode_prevents_unregistered_write(self, project_path: Path, monkeypatch: Any) -> None:
-        """Test that strict mode prevents writing to unregistered locations."""
-        monkeypatch.setenv("SUNSTONE_DATAFRAME_STRICT", "1")
 
-        strict_df = sunstone.DataFrame.read_csv("inputs/official_un_member_states_raw.csv", project_path=project_path)
+@pytest.fixture(scope="module")
+def strict_df(project_path: Path) -> sunstone.DataFrame:
+    """DataFrame created while SUNSTONE_DATAFRAME_STRICT enables strict mode, shared by the module."""
+    # The environment variable is only set while creating it, so other tests keep relaxed mode
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SUNSTONE_DATAFRAME_STRICT", "1")
+        return sunstone.DataFrame({"a": [1], "b": [2]}, project_path=project_path)
 
+
+class TestStrictMode:
+    """Tests for strict mode functionality."""
+
+    def test_strict_mode_load(self, strict_df: sunstone.DataFrame) -> None:
+        """Test that DataFrames are created in strict mode when the environment variable is set."""
+        assert strict_df.strict_mode is True
+
+    def test_strict_mode_prevents_unregistered_write(self, strict_df: sunstone.DataFrame) -> None:
+        """Test that strict mode prevents writing to unregistered locations."""
         with pytest.raises(sunstone.StrictModeError):
             strict_df.to_csv("/tmp/test_output.csv", index=False)
 
+    def test_set_default_strict_overrides_environment(self, monkeypatch: Any) -> None:
+        """Test that set_default_strict() takes precedence over the environment variable."""
+        monkeypatch.setenv("SUNSTONE_DATAFRAME_STRICT", "1")
+        sunstone.set_default_strict(False)
+        try:
+            assert sunstone.DataFrame({"a": [1]}).strict_mode is False
+            assert sunstone.DataFrame({"a": [1]}, strict=True).strict_mode is True
+        finally:
+            sunstone.set_default_strict(None)
 
-class TestReadDataset:
-    """Tests for read_dataset() functionality with format auto-detection."""
+        assert sunstone.DataFrame({"a": [1]}).strict_mode is True
 
-    def test_read_dataset_by_slug(self, project_path: Path) -> None:
-        """Test reading a dataset by slug with auto-detection."""
-        df = sunstone.DataFrame.read_dataset(
-            "official-un-member-states",
-            project_path=project_path,
-            strict=False,
-        )
-
-        assert df is not None
-        assert len(df.data) > 0
-        assert len(df.data.columns) > 0
-        assert len(df.lineage.sources) > 0
-        # Check that the source is tracked
-        assert df.lineage.sources[0].slug == "official-un-member-states"
-
-    def test_read_dataset_with_explicit_format(self, project_path: Path) -> None:
-        """Test reading a dataset with explicit format override."""
-        df = sunstone.DataFrame.read_dataset(
-            "official-un-member-states",
-            project_path=project_path,
-            format="csv",
-            strict=False,
-        )
 
-        assert df is not None
-        assert len(df.data) > 0
-        assert len(df.lineage.sources) > 0
+class TestReadDataset:
+    """Tests for read_dataset() functionality with format auto-detection."""
 
     def test_read_dataset_slug_not_found(self, project_path: Path) -> None:
         """Test that reading non-existent slug raises error."""
@@ -185,45 +349,58 @@ class TestReadDataset:
 
         assert "not found in datasets.yaml" in str(exc_info.value)
 
-    def test_read_dataset_via_pandas_api(self, project_path: Path) -> None:
-        """Test reading dataset via pandas-like API."""
-        from sunstone import pandas as pd
+    def test_iter_dataset_in_chunks(self, project_path: Path) -> None:
+        """Test that iterating a dataset in chunks yields all rows with lineage."""
+        full = sunstone.DataFrame.read_dataset("official-un-member-states", project_path=project_path, strict=False)
 
-        df = pd.read_dataset(
-            "official-un-member-states",
-            project_path=project_path,
+        chunks = list(
+            sunstone.DataFrame.iter_dataset(
+                "official-un-member-states", chunksize=50, project_path=project_path, strict=False
+            )
         )
 
-        assert df is not None
-        assert len(df.data) > 0
-        assert isinstance(df, sunstone.DataFrame)
-
-    def test_read_csv_with_slug_delegates_to_read_dataset(self, project_path: Path) -> None:
-        """Test that read_csv with slug delegates to read_dataset."""
-        df = sunstone.DataFrame.read_csv(
-            "official-un-member-states",
-            project_path=project_path,
-            strict=False,
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 50 for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == len(full)
+        assert all(chunk.lineage.sources[0].slug == "official-un-member-states" for chunk in chunks)
+
+    def test_iter_dataset_closes_abandoned_reader(self, project_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the file is only opened once iterated, and closed when the iteration is abandoned."""
+        readers = []
+        read_csv = pd.read_csv
+
+        def spy_read_csv(*args: Any, **kwargs: Any) -> Any:
+            reader = read_csv(*args, **kwargs)
+            reader.close = unittest.mock.Mock(wraps=reader.close)
+            readers.append(reader)
+            return reader
+
+        monkeypatch.setattr(pd, "read_csv", spy_read_csv)
+        chunks = sunstone.DataFrame.iter_dataset(
+            "official-un-member-states", chunksize=50, project_path=project_path, strict=False
         )
+        assert readers == []
 
-        assert df is not None
-        assert len(df.data) > 0
-        # Check that the source is tracked
-        assert len(df.lineage.sources) > 0
+        assert len(next(chunks)) == 50
+        readers[0].close.assert_not_called()
+        chunks.close()  # type: ignore[attr-defined]
+        readers[0].close.assert_called()
+
+    def test_iter_dataset_slug_not_found(self, project_path: Path) -> None:
+        """Test that a missing slug is reported before iteration starts."""
+        with pytest.raises(sunstone.DatasetNotFoundError):
+            sunstone.DataFrame.iter_dataset("nonexistent-dataset", chunksize=10, project_path=project_path)
 
 
+@pytest.mark.slow
 class TestContentHashLineage:
     """Tests for content-hash based lineage tracking."""
 
     def test_content_hash_computed_on_save(self, project_path: Path, tmp_path: Path) -> None:
         """Test that content hash is computed and saved when writing output."""
-        import shutil
-
-        from ruamel.yaml import YAML
-
         # Create a copy of the project in tmp_path to avoid modifying original
         test_project = tmp_path / "test_project"
-        shutil.copytree(project_path, test_project)
+        _overlay_project(project_path, test_project)
 
         df = sunstone.DataFrame.read_csv(
             "inputs/official_un_member_states_raw.csv",
@@ -236,29 +413,117 @@ class TestContentHashLineage:
         df.to_csv(output_path, slug="test-output", name="Test Output", index=False)
 
         # Read the datasets.yaml and check for content_hash
-        yaml = YAML()
-        with open(test_project / "datasets.yaml") as f:
-            data = yaml.load(f)
-
-        # Find the output dataset
-        output = next((d for d in data.get("outputs", []) if d["slug"] == "test-output"), None)
-        assert output is not None
+        output = _load_outputs(test_project)["test-output"]
         assert "lineage" in output
         assert "content_hash" in output["lineage"]
         assert "created_at" in output["lineage"]
         # Hash should be a 64-character hex string (SHA256)
         assert len(output["lineage"]["content_hash"]) == 64
 
-    def test_timestamp_not_updated_when_content_unchanged(self, project_path: Path, tmp_path: Path) -> None:
+    def test_to_csv_recreates_removed_output_directory(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that writing still works after the output directory was removed."""
+        test_project = tmp_path / "test_project"
+        _overlay_project(project_path, test_project)
+
+        df = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv",
+            project_path=test_project,
+            strict=False,
+        )
+
+        output_path = "outputs/nested/test_output.csv"
+        df.to_csv(output_path, slug="test-output", name="Test Output", index=False)
+        shutil.rmtree(test_project / "outputs" / "nested")
+        df.to_csv(output_path, slug="test-output", name="Test Output", index=False)
+
+        assert (test_project / output_path).exists()
+
+    def test_to_csv_tolerates_concurrently_recreated_directory(
+        self, project_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that writing succeeds when another writer recreates a removed output directory first."""
+        test_project = tmp_path / "test_project"
+        _overlay_project(project_path, test_project)
+        df = sunstone.DataFrame({"a": [1, 2]}, project_path=test_project, strict=False)
+
+        output_path = "outputs/racy/test_output.csv"
+        df.to_csv(output_path, slug="racy-output", name="Racy Output", index=False)
+        parent = test_project / "outputs" / "racy"
+        shutil.rmtree(parent)
+
+        isdir = os.path.isdir
+
+        def isdir_then_recreate(path: Any) -> bool:
+            result = isdir(path)
+            if os.fspath(path) == str(parent):
+                # Another writer recreates the directory right after the check
+                parent.mkdir(exist_ok=True)
+            return result
+
+        monkeypatch.setattr(os.path, "isdir", isdir_then_recreate)
+        df.to_csv(output_path, index=False)
+
+        assert (test_project / output_path).exists()
+
+    def test_batch_writes_saves_datasets_yaml_on_exit(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that outputs written in a batch are registered when the batch ends."""
+        test_project = tmp_path / "test_project"
+        _overlay_project(project_path, test_project)
+        datasets_file = test_project / "datasets.yaml"
+        original = datasets_file.read_text()
+
+        df = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv",
+            project_path=test_project,
+            strict=False,
+        )
+
+        with df.batch_writes():
+            df.to_csv("outputs/first.csv", slug="first-output", name="First Output", index=False)
+            df.head(5).to_csv("outputs/second.csv", slug="second-output", name="Second Output", index=False)
+            assert datasets_file.read_text() == original
+            assert (test_project / "outputs" / "second.csv").exists()
+
+        outputs = _load_outputs(test_project)
+        assert "content_hash" in outputs["first-output"]["lineage"]
+        assert "content_hash" in outputs["second-output"]["lineage"]
+
+    def test_strict_write_in_batch_checks_pending_changes(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that strict writes in a batch compare lineage with the changes not yet saved."""
+        test_project = tmp_path / "test_project"
+        _overlay_project(project_path, test_project)
+
+        relaxed = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv", project_path=test_project, strict=False
+        )
+        strict = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv", project_path=test_project, strict=True
+        )
+        relaxed.to_csv("outputs/first.csv", slug="first-output", name="First Output", index=False)
+        relaxed.to_csv("outputs/second.csv", slug="second-output", name="Second Output", index=False)
+        first_hash = _load_outputs(test_project)["first-output"]["lineage"]["content_hash"]
+
+        with relaxed.batch_writes():
+            relaxed.head(5).to_csv("outputs/first.csv", index=False)
+            # second-output's lineage is unchanged, though datasets.yaml on disk is now out of date
+            strict.to_csv("outputs/second.csv", index=False)
+            with pytest.raises(sunstone.DatasetValidationError):
+                strict.to_csv("outputs/first.csv", index=False)
+
+        assert _load_outputs(test_project)["first-output"]["lineage"]["content_hash"] != first_hash
+
+    def test_timestamp_not_updated_when_content_unchanged(
+        self, project_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that timestamp stays the same when saving identical content."""
-        import shutil
-        import time
+        import sunstone.datasets
 
-        from ruamel.yaml import YAML
+        clock = iter([datetime(2024, 1, 1, 0, 0, 0), datetime(2024, 1, 1, 0, 0, 1)])
+        monkeypatch.setattr(sunstone.datasets, "_now", lambda: next(clock))
 
         # Create a copy of the project in tmp_path
         test_project = tmp_path / "test_project"
-        shutil.copytree(project_path, test_project)
+        _overlay_project(project_path, test_project)
 
         df = sunstone.DataFrame.read_csv(
             "inputs/official_un_member_states_raw.csv",
@@ -272,18 +537,10 @@ class TestContentHashLineage:
         df.to_csv(output_path, slug="stable-output", name="Stable Output", index=False)
 
         # Read the first timestamp and hash
-        yaml = YAML()
-        with open(test_project / "datasets.yaml") as f:
-            data1 = yaml.load(f)
-
-        output1 = next((d for d in data1.get("outputs", []) if d["slug"] == "stable-output"), None)
-        assert output1 is not None
+        output1 = _load_outputs(test_project)["stable-output"]
         first_timestamp = output1["lineage"]["created_at"]
         first_hash = output1["lineage"]["content_hash"]
 
-        # Wait a bit to ensure different timestamp would be generated
-        time.sleep(0.1)
-
         # Reload the manager and write again with the same data
         df2 = sunstone.DataFrame.read_csv(
             "inputs/official_un_member_states_raw.csv",
@@ -293,11 +550,7 @@ class TestContentHashLineage:
         df2.to_csv(output_path, slug="stable-output", name="Stable Output", index=False)
 
         # Read the second timestamp and hash
-        with open(test_project / "datasets.yaml") as f:
-            data2 = yaml.load(f)
-
-        output2 = next((d for d in data2.get("outputs", []) if d["slug"] == "stable-output"), None)
-        assert output2 is not None
+        output2 = _load_outputs(test_project)["stable-output"]
         second_timestamp = output2["lineage"]["created_at"]
         second_hash = output2["lineage"]["content_hash"]
 
@@ -306,16 +559,18 @@ class TestContentHashLineage:
         # Timestamp should NOT have changed since content is identical
         assert first_timestamp == second_timestamp
 
-    def test_timestamp_updated_when_content_changes(self, project_path: Path, tmp_path: Path) -> None:
+    def test_timestamp_updated_when_content_changes(
+        self, project_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that timestamp is updated when content actually changes."""
-        import shutil
-        import time
+        import sunstone.datasets
 
-        from ruamel.yaml import YAML
+        clock = iter([datetime(2024, 1, 1, 0, 0, 0), datetime(2024, 1, 1, 0, 0, 1)])
+        monkeypatch.setattr(sunstone.datasets, "_now", lambda: next(clock))
 
         # Create a copy of the project in tmp_path
         test_project = tmp_path / "test_project"
-        shutil.copytree(project_path, test_project)
+        _overlay_project(project_path, test_project)
 
         df = sunstone.DataFrame.read_csv(
             "inputs/official_un_member_states_raw.csv",
@@ -329,18 +584,10 @@ class TestContentHashLineage:
         df.to_csv(output_path, slug="changing-output", name="Changing Output", index=False)
 
         # Read the first timestamp and hash
-        yaml = YAML()
-        with open(test_project / "datasets.yaml") as f:
-            data1 = yaml.load(f)
-
-        output1 = next((d for d in data1.get("outputs", []) if d["slug"] == "changing-output"), None)
-        assert output1 is not None
+        output1 = _load_outputs(test_project)["changing-output"]
         first_timestamp = output1["lineage"]["created_at"]
         first_hash = output1["lineage"]["content_hash"]
 
-        # Wait a bit to ensure different timestamp
-        time.sleep(0.1)
-
         # Modify the data and write again
         df2 = sunstone.DataFrame.read_csv(
             "inputs/official_un_member_states_raw.csv",
@@ -352,11 +599,7 @@ class TestContentHashLineage:
         df2_modified.to_csv(output_path, slug="changing-output", name="Changing Output", index=False)
 
         # Read the second timestamp and hash
-        with open(test_project / "datasets.yaml") as f:
-            data2 = yaml.load(f)
-
-        output2 = next((d for d in data2.get("outputs", []) if d["slug"] == "changing-output"), None)
-        assert output2 is not None
+        output2 = _load_outputs(test_project)["changing-output"]
         second_timestamp = output2["lineage"]["created_at"]
         second_hash = output2["lineage"]["content_hash"]
 
@@ -364,3 +607,203 @@ class TestContentHashLineage:
         assert first_hash != second_hash
         # Timestamp SHOULD have changed since content is different
         assert first_timestamp != second_timestamp
+
+
+class TestDatasetsManagerCache:
+    """Tests for the per-project DatasetsManager cache."""
+
+    def test_manager_shared_between_dataframes(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
+        """Test that DataFrames from the same project share one DatasetsManager."""
+        df1 = read_un_members()
+        df2 = df1.head(5)
+
+        assert df1._get_datasets_manager() is df2._get_datasets_manager()
+
+    def test_manager_reloads_modified_datasets_yaml(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that edits made to datasets.yaml outside the manager are picked up."""
+        test_project = tmp_path / "test_project"
+        _overlay_project(project_path, test_project)
+
+        df = sunstone.DataFrame.read_csv(
+            "inputs/official_un_member_states_raw.csv", project_path=test_project, strict=False
+        )
+        manager = df._get_datasets_manager()
+        assert manager.find_dataset_by_slug("renamed-un-member-states") is None
+
+        datasets_file = test_project / "datasets.yaml"
+        content = datasets_file.read_text()
+        datasets_file.write_text(content.replace("slug: official-un-member-states", "slug: renamed-un-member-states"))
+
+        renamed = sunstone.DataFrame.read_dataset("renamed-un-member-states", project_path=test_project)
+        assert renamed.lineage.sources[0].slug == "renamed-un-member-states"
+        assert renamed._get_datasets_manager() is manager
+
+
+class TestInferFieldSchema:
+    """Tests for inferring datasets.yaml field schemas from DataFrame dtypes."""
+
+    def test_infer_field_types(self, project_path: Path) -> None:
+        """Test that pandas dtypes map to dataset field types."""
+        df = sunstone.DataFrame(
+            {
+                "count": [1, 2],
+                "unsigned": pd.array([1, 2], dtype="uint8"),
+                "nullable_count": pd.array([1, None], dtype="Int64"),
+                "ratio": [0.5, 1.5],
+                "nullable_ratio": pd.array([0.5, None], dtype="Float64"),
+                "complex": [1 + 2j, 3 + 4j],
+                "flag": [True, False],
+                "when": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                "when_utc": pd.to_datetime(["2024-01-01", "2024-01-02"], utc=True),
+                "duration": pd.to_timedelta([1, 2], unit="D"),
+                "label": ["a", "b"],
+                "category": pd.Categorical(["x", "y"]),
+            },
+            project_path=project_path,
+        )
+
+        fields = df._infer_field_schema()
+
+        assert [(f.name, f.type) for f in fields] == [
+            ("count", "integer"),
+            ("unsigned", "integer"),
+            ("nullable_count", "integer"),
+            ("ratio", "number"),
+            ("nullable_ratio", "number"),
+            ("complex", "string"),
+            ("flag", "boolean"),
+            ("when", "datetime"),
+            ("when_utc", "datetime"),
+            ("duration", "string"),
+            ("label", "string"),
+            ("category", "string"),
+        ]
+
+    def test_infer_field_schema_returns_new_list(self, project_path: Path) -> None:
+        """Test that repeated inference returns equal but independent lists."""
+        df = sunstone.DataFrame({"a": [1], "b": ["x"]}, project_path=project_path)
+
+        first = df._infer_field_schema()
+        second = df._infer_field_schema()
+
+        assert first == second
+        assert first is not second
+
+        first.append(sunstone.FieldSchema(name="c", type="string"))
+        assert len(df._infer_field_schema()) == 2
+
+
+class TestAttributeDelegation:
+    """Tests for delegating attribute access to the pandas DataFrame."""
+
+    def test_delegated_methods_follow_data(self) -> None:
+        """Test that delegated methods keep working when the data is replaced."""
+        df = sunstone.DataFrame({"a": [3, 1, 2]})
+        assert list(df.sort_values("a")["a"]) == [1, 2, 3]
+
+        df.data = pd.DataFrame({"a": [9, 8]})
+        assert list(df.sort_values("a")["a"]) == [8, 9]
+        assert isinstance(df.head(1), sunstone.DataFrame)
+
+    def test_attribute_access_does_not_modify_class(self) -> None:
+        """Test that delegates exist up front and attribute access never adds attributes to the class."""
+        assert "sort_values" in dir(sunstone.DataFrame)
+        assert "T" in dir(sunstone.DataFrame)
+        assert "merge" in vars(sunstone.DataFrame)
+        attributes = set(vars(sunstone.DataFrame))
+
+        df = sunstone.DataFrame({"a": [1, 2]})
+        df.plot  # noqa: B018
+        df.a  # noqa: B018
+        df.transform(lambda x: x)
+
+        assert set(vars(sunstone.DataFrame)) == attributes
+
+    def test_delegated_properties_follow_data(self) -> None:
+        """Test that delegated properties are read from the current data and wrapped."""
+        df = sunstone.DataFrame({"a": [1, 2]})
+        assert df.T.shape == (1, 2)
+
+        df.data = pd.DataFrame({"a": [1, 2, 3]})
+        assert isinstance(df.T, sunstone.DataFrame)
+        assert df.T.shape == (1, 3)
+        assert df.values.tolist() == [[1], [2], [3]]
+
+    def test_scalar_attributes_passthrough(self) -> None:
+        """Test that scalar attributes are returned from the pandas DataFrame."""
+        df = sunstone.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        assert df.shape == (2, 2)
+        assert list(df.columns) == ["a", "b"]
+        assert df.ndim == 2
+        assert not df.empty
+        assert isinstance(df.T, sunstone.DataFrame)
+
+    def test_no_lineage_returns_pandas_results(self) -> None:
+        """Test that results are not wrapped while lineage is suspended."""
+        df = sunstone.DataFrame({"a": [3, 1, 2], "b": ["x", "y", "z"]})
+
+        with sunstone.DataFrame.no_lineage():
+            filtered = df[df["a"] > 1]
+            with sunstone.DataFrame.no_lineage():
+                assert not isinstance(df.head(1), sunstone.DataFrame)
+            assert not isinstance(df.sort_values("a"), sunstone.DataFrame)
+
+        assert isinstance(filtered, pd.DataFrame)
+        assert not isinstance(filtered, sunstone.DataFrame)
+        assert isinstance(df.head(1), sunstone.DataFrame)
+
+    def test_indexer_writes_do_not_modify_parent(self) -> None:
+        """Test that writing through .loc and .iloc on a derived DataFrame leaves its parent unchanged."""
+        df = sunstone.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+        head = df.head(2)
+        head.loc[0, "a"] = 10
+        sub = df.iloc[:2]
+        sub.iloc[0, 1] = 40
+
+        assert list(head["a"]) == [10, 2]
+        assert list(sub["b"]) == [40, 5]
+        assert list(df["a"]) == [1, 2, 3]
+        assert list(df["b"]) == [4, 5, 6]
+
+    def test_no_option_context_when_copy_on_write_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that Sunstone doesn't switch pandas options per call when copy-on-write is already on."""
+        assert pd.options.mode.copy_on_write is True
+
+        def option_context(*args: Any) -> Any:
+            raise AssertionError("pd.option_context() was entered")
+
+        monkeypatch.setattr(pd, "option_context", option_context)
+        df = sunstone.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        df["c"] = df.data["a"] * 2
+        merged = df.merge(df, on="a")
+        assert len(merged) == 3
+
+    def test_setitem_does_not_modify_parent(self) -> None:
+        """Test that assigning to a derived DataFrame leaves the DataFrame it came from unchanged."""
+        df = sunstone.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+        head = df.head(2)
+        head["b"] = 0
+
+        assert list(head["b"]) == [0, 0]
+        assert list(df["b"]) == [4, 5, 6]
+
+
+class TestPackageImports:
+    """Tests for the sunstone package namespace."""
+
+    def test_import_does_not_load_pandas(self) -> None:
+        """Test that pandas is only imported when DataFrame support is used."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, sunstone; "
+            "assert 'pandas' not in sys.modules; "
+            "sunstone.check_script_imports; "
+            "assert 'pandas' not in sys.modules; "
+            "from sunstone import pandas as pd; "
+            "assert sunstone.DataFrame is pd.DataFrame"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
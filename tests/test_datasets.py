@@ -2,6 +2,8 @@
 Tests for Sunstone DatasetsManager functionality.
 """
 
+import dataclasses
+import shutil
 import socket
 import unittest.mock
 from pathlib import Path
@@ -10,8 +12,10 @@ from typing import Any
 
 
 import pytest
+import requests
 import sunstone
 from sunstone.datasets import _is_public_url
+from sunstone.lineage import DatasetMetadata
 
 
 def mock_getaddrinfo(ip: str) -> list[tuple[Any, ...]]:
@@ -22,6 +26,13 @@ def mock_getaddrinfo(ip: str) -> list[tuple[Any, ...]]:
         return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", (ip, 0))]
 
 
+def with_source_url(dataset: DatasetMetadata, url: str) -> DatasetMetadata:
+    """Copy a dataset with its source data URL replaced."""
+    assert dataset.source is not None
+    location = dataclasses.replace(dataset.source.location, data=url)
+    return dataclasses.replace(dataset, source=dataclasses.replace(dataset.source, location=location))
+
+
 class TestDatasetsManager:
     """Tests for DatasetsManager class."""
 
@@ -30,10 +41,9 @@ class TestDatasetsManager:
         manager = sunstone.DatasetsManager(project_path)
         assert manager is not None
 
-    def test_find_dataset_by_slug(self, project_path: Path) -> None:
+    def test_find_dataset_by_slug(self, datasets_manager: sunstone.DatasetsManager) -> None:
         """Test finding a dataset by its slug."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        dataset = datasets_manager.find_dataset_by_slug("official-un-member-states")
 
         assert dataset is not None
         assert dataset.name == "Official UN Member States"
@@ -43,26 +53,292 @@ class TestDatasetsManager:
         if dataset.source:
             assert dataset.source.license is not None
 
-    def test_find_nonexistent_dataset(self, project_path: Path) -> None:
+    def test_find_nonexistent_dataset(self, datasets_manager: sunstone.DatasetsManager) -> None:
         """Test that finding a non-existent dataset returns None."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("does-not-exist")
+        dataset = datasets_manager.find_dataset_by_slug("does-not-exist")
         assert dataset is None
 
+    def test_lookups_return_independent_copies(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that changing a dataset returned by the shared manager doesn't affect later lookups."""
+        (tmp_path / "datasets.yaml").write_text((project_path / "datasets.yaml").read_text())
+        shutil.copytree(project_path / "inputs", tmp_path / "inputs")
+
+        dataset = sunstone.DatasetsManager.get(tmp_path).find_dataset_by_slug("official-un-member-states")
+        assert dataset is not None and dataset.source is not None
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            dataset.name = "Changed"  # type: ignore[misc]
+        dataset.fields.clear()
+
+        again = sunstone.DatasetsManager.get(tmp_path).find_dataset_by_slug("official-un-member-states")
+        assert again is not None
+        assert again.fields
+        assert sunstone.DatasetsManager.get(tmp_path).get_all_inputs()[0].fields
+        df = sunstone.DataFrame.read_dataset("official-un-member-states", project_path=tmp_path, strict=False)
+        assert df.lineage.sources[0].fields
+
+    def test_malformed_entry_only_breaks_its_own_lookup(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that a malformed dataset entry doesn't break lookups of other datasets."""
+        content = (project_path / "datasets.yaml").read_text()
+        content = content.replace(
+            "inputs:\n", "inputs:\n  - name: Broken\n    slug: broken\n    location: inputs/broken.csv\n", 1
+        )
+        (tmp_path / "datasets.yaml").write_text(content)
+        manager = sunstone.DatasetsManager(tmp_path)
+
+        assert manager.find_dataset_by_slug("official-un-member-states") is not None
+        assert manager.find_dataset_by_location("inputs/official_un_member_states_raw.csv") is not None
+        with pytest.raises(sunstone.DatasetValidationError, match="'broken'"):
+            manager.find_dataset_by_slug("broken")
+        with pytest.raises(sunstone.DatasetValidationError, match="'broken'"):
+            manager.get_all_inputs()
+
+    def test_get_shares_manager_per_project(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that DatasetsManager.get() returns one manager per project that follows file edits."""
+        import os
+
+        datasets_file = tmp_path / "datasets.yaml"
+        datasets_file.write_text((project_path / "datasets.yaml").read_text())
+
+        manager = sunstone.DatasetsManager.get(tmp_path)
+        assert sunstone.DatasetsManager.get(str(tmp_path / "." / "")) is manager
+
+        # Keep the original mtime, as an edit within the filesystem's timestamp granularity would
+        stat = datasets_file.stat()
+        datasets_file.write_text(datasets_file.read_text().replace("slug: official-un-member-states", "slug: renamed"))
+        os.utime(datasets_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert sunstone.DatasetsManager.get(tmp_path) is manager
+        assert manager.find_dataset_by_slug("renamed") is not None
+
+        # A same-size edit that atomically replaces the file is detected by its new inode
+        replacement = tmp_path / "replacement.yaml"
+        replacement.write_text(datasets_file.read_text().replace("slug: renamed", "slug: ranamed"))
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, datasets_file)
+
+        assert sunstone.DatasetsManager.get(tmp_path) is manager
+        assert manager.find_dataset_by_slug("ranamed") is not None
+
+    def test_get_keeps_manager_with_deferred_writes(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that a shared manager isn't replaced while its writes are deferred, however many projects are used."""
+        projects = []
+        for i in range(40):
+            projects.append(tmp_path / f"project{i}")
+            projects[-1].mkdir()
+            (projects[-1] / "datasets.yaml").write_text((project_path / "datasets.yaml").read_text())
+
+        manager = sunstone.DatasetsManager.get(projects[0])
+        with manager.deferred_writes():
+            manager.add_output_dataset(
+                name="Extra Output",
+                slug="extra-output",
+                location="outputs/extra.csv",
+                fields=[sunstone.FieldSchema(name="a", type="integer")],
+            )
+            for project in projects[1:]:
+                sunstone.DatasetsManager.get(project)
+
+            assert sunstone.DatasetsManager.get(projects[0]) is manager
+            assert sunstone.DatasetsManager.get(projects[0]).find_dataset_by_slug("extra-output") is not None
+
+    def test_yaml_1_2_booleans(self, tmp_path: Path) -> None:
+        """Test that YAML 1.1 boolean words like 'NO' are read as strings."""
+        (tmp_path / "datasets.yaml").write_text(
+            "inputs:\n"
+            "  - name: Norway\n"
+            "    slug: NO\n"
+            "    location: inputs/no.csv\n"
+            "    publish: true\n"
+            "    fields:\n"
+            "      - name: on\n"
+            "        type: string\n"
+        )
+        manager = sunstone.DatasetsManager(tmp_path)
+        dataset = manager.find_dataset_by_slug("NO")
+
+        assert dataset is not None
+        assert dataset.publish is True
+        assert dataset.fields[0].name == "on"
+
+    def test_comments_preserved_on_write(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that comments in datasets.yaml survive registering an output."""
+        datasets_file = tmp_path / "datasets.yaml"
+        datasets_file.write_text("# Project datasets\n" + (project_path / "datasets.yaml").read_text())
+
+        manager = sunstone.DatasetsManager(tmp_path)
+        manager.add_output_dataset(
+            name="Extra Output",
+            slug="extra-output",
+            location="outputs/extra.csv",
+            fields=[sunstone.FieldSchema(name="a", type="integer")],
+        )
+
+        assert datasets_file.read_text().startswith("# Project datasets\n")
+        assert manager.find_dataset_by_slug("extra-output", "output") is not None
+
+    def test_write_with_quoted_field_types(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that outputs can be written to a datasets.yaml that quotes its field types."""
+        datasets_file = tmp_path / "datasets.yaml"
+        datasets_file.write_text((project_path / "datasets.yaml").read_text().replace("type: string", 'type: "string"'))
+
+        manager = sunstone.DatasetsManager(tmp_path)
+        manager.add_output_dataset(
+            name="Extra Output",
+            slug="extra-output",
+            location="outputs/extra.csv",
+            fields=[sunstone.FieldSchema(name="a", type="integer")],
+        )
+
+        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        assert dataset is not None
+        assert type(dataset.fields[0].type) is str
+        assert 'type: "string"' in datasets_file.read_text()
+        assert manager.find_dataset_by_slug("extra-output", "output") is not None
+
+    def test_unchanged_save_keeps_file(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that saving data identical to datasets.yaml doesn't rewrite it."""
+        import os
+
+        datasets_file = tmp_path / "datasets.yaml"
+        datasets_file.write_text((project_path / "datasets.yaml").read_text())
+        os.chmod(datasets_file, 0o640)
+        manager = sunstone.DatasetsManager(tmp_path)
+        fields = [sunstone.FieldSchema(name="a", type="integer")]
+
+        manager.add_output_dataset(
+            name="Extra Output", slug="extra-output", location="outputs/extra.csv", fields=fields
+        )
+        stat = datasets_file.stat()
+        manager.update_output_dataset("extra-output", fields=fields)
+
+        assert datasets_file.stat().st_mtime_ns == stat.st_mtime_ns
+        assert datasets_file.stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.glob("datasets_*")) == []
+
+    def test_find_dataset_by_location(self, project_path: Path, tmp_path: Path) -> None:
+        """Test finding datasets by normalized location, including newly registered outputs."""
+        (tmp_path / "datasets.yaml").write_text((project_path / "datasets.yaml").read_text())
+        manager = sunstone.DatasetsManager(tmp_path)
+
+        dataset = manager.find_dataset_by_location("./inputs/official_un_member_states_raw.csv")
+        assert dataset is not None
+        assert dataset.slug == "official-un-member-states"
+        assert manager.find_dataset_by_location("inputs/official_un_member_states_raw.csv", "output") is None
+
+        manager.add_output_dataset(
+            name="Extra Output",
+            slug="extra-output",
+            location="outputs/extra.csv",
+            fields=[sunstone.FieldSchema(name="a", type="integer")],
+        )
+        output = manager.find_dataset_by_location(str(tmp_path / "outputs" / "extra.csv"), "output")
+        assert output is not None
+        assert output.slug == "extra-output"
+
+    def test_find_dataset_by_resolved_location(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that locations matching only after resolution are found without re-resolving datasets."""
+        (tmp_path / "datasets.yaml").write_text((project_path / "datasets.yaml").read_text())
+        manager = sunstone.DatasetsManager(tmp_path)
+
+        dataset = manager.find_dataset_by_location("outputs/../inputs/official_un_member_states_raw.csv")
+        assert dataset is not None
+        assert dataset.slug == "official-un-member-states"
+
+        with patch("sunstone.datasets.Path.resolve", autospec=True, side_effect=Path.resolve) as resolve:
+            manager.find_dataset_by_location("data/../inputs/official_un_member_states_raw.csv")
+        assert resolve.call_count == 1
+
+    def test_find_dataset_by_linked_location(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that a hard link to a registered file finds its dataset."""
+        shutil.copytree(project_path, tmp_path / "project")
+        manager = sunstone.DatasetsManager(tmp_path / "project")
+        (tmp_path / "project" / "linked.csv").hardlink_to(
+            tmp_path / "project" / "inputs" / "official_un_member_states_raw.csv"
+        )
+
+        dataset = manager.find_dataset_by_location("linked.csv")
+        assert dataset is not None
+        assert dataset.slug == "official-un-member-states"
+        assert manager.find_dataset_by_location("missing.csv") is None
+
+    def test_parsed_datasets_cached_until_saved(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that lookups reuse parsed metadata until datasets.yaml is saved."""
+        (tmp_path / "datasets.yaml").write_text((project_path / "datasets.yaml").read_text())
+        manager = sunstone.DatasetsManager(tmp_path)
+
+        with patch.object(manager, "_parse_dataset", wraps=manager._parse_dataset) as parse:
+            dataset = manager.find_dataset_by_slug("official-un-member-states")
+            assert manager.find_dataset_by_slug("official-un-member-states") == dataset
+            assert manager.get_all_inputs()[0] == dataset
+            assert parse.call_count == 1
+
+            manager.add_output_dataset(
+                name="Extra Output",
+                slug="extra-output",
+                location="outputs/extra.csv",
+                fields=[sunstone.FieldSchema(name="a", type="integer")],
+            )
+            assert [output.slug for output in manager.get_all_outputs()][-1] == "extra-output"
+            parse.reset_mock()
+            manager.find_dataset_by_slug("official-un-member-states")
+            assert parse.call_count == 1
+
 
 class TestURLSafety:
     """Tests for URL safety validation (SSRF prevention)."""
 
-    def test_valid_https_url(self) -> None:
-        """Test that valid HTTPS URLs to public addresses are allowed."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34")):
-            assert _is_public_url("https://example.com/data.csv") is True
-            assert _is_public_url("https://www.google.com/file.json") is True
-
-    def test_valid_http_url(self) -> None:
-        """Test that valid HTTP URLs to public addresses are allowed."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34")):
-            assert _is_public_url("http://example.com/data.csv") is True
+    @pytest.mark.parametrize(
+        ("resolved_ip", "url", "expected"),
+        [
+            # Public addresses
+            ("93.184.216.34", "https://example.com/data.csv", True),
+            ("93.184.216.34", "https://www.google.com/file.json", True),
+            ("93.184.216.34", "http://example.com/data.csv", True),
+            # Localhost and loopback
+            ("127.0.0.1", "http://localhost/api", False),
+            ("127.0.0.1", "http://localhost:8080/data", False),
+            ("127.0.0.1", "http://127.0.0.1/api", False),
+            ("127.0.0.2", "http://127.0.0.2:8080/data", False),
+            # Private ranges
+            ("10.0.0.1", "http://internal.example.com/api", False),
+            ("10.255.255.254", "http://10.255.255.254/data", False),
+            ("192.168.1.1", "http://router.local/config", False),
+            ("192.168.100.50", "http://192.168.100.50/api", False),
+            ("172.16.0.1", "http://internal-app.local/data", False),
+            ("172.31.255.255", "http://172.31.255.255/api", False),
+            # Link-local, including cloud metadata endpoints
+            ("169.254.169.254", "http://169.254.169.254/metadata", False),
+            ("169.254.169.254", "http://169.254.169.254/latest/meta-data/", False),
+            # IPv6 loopback, link-local and unique local (fc00::/7, including fd00::)
+            ("::1", "http://localhost/api", False),
+            ("::1", "http://[::1]/api", False),
+            ("::1", "http://[::1]:8080/data", False),
+            ("fe80::1", "http://ipv6-link-local.example.com/data", False),
+            ("fe80::1234:5678:abcd:ef01", "http://[fe80::1234:5678:abcd:ef01]/api", False),
+            ("fc00::1", "http://internal-ipv6.example.com/data", False),
+            ("fd00::1", "http://private-ipv6.example.com/api", False),
+            ("fd12:3456:789a::1", "http://[fd12:3456:789a::1]:8080/data", False),
+            # IPv4-mapped IPv6 addresses are judged by their IPv4 address
+            ("::ffff:127.0.0.1", "http://mapped.example.com/data", False),
+            ("::ffff:10.0.0.1", "http://[::ffff:10.0.0.1]/api", False),
+            ("::ffff:93.184.216.34", "http://[::ffff:93.184.216.34]/data", True),
+            # Multicast, reserved and unspecified
+            ("224.0.0.1", "http://224.0.0.1/data", False),
+            ("ff02::1", "http://[ff02::1]/data", False),
+            ("240.0.0.1", "http://240.0.0.1/data", False),
+            ("0.0.0.0", "http://0.0.0.0/data", False),
+            ("::", "http://[::]/data", False),
+            # Carrier-grade NAT, NAT64 and 6to4
+            ("100.64.0.1", "http://100.64.0.1/data", False),
+            ("192.88.99.1", "http://192.88.99.1/data", False),
+            ("64:ff9b::a00:1", "http://[64:ff9b::a00:1]/data", False),
+            ("2002:a00:1::1", "http://[2002:a00:1::1]/data", False),
+        ],
+    )
+    def test_url_safety(self, resolved_ip: str, url: str, expected: bool) -> None:
+        """Test that URLs are allowed only if their hostname resolves to a public address."""
+        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo(resolved_ip)):
+            assert _is_public_url(url) is expected
 
     def test_file_scheme_blocked(self) -> None:
         """Test that file:// URLs are blocked."""
@@ -73,75 +349,6 @@ class TestURLSafety:
         """Test that FTP URLs are blocked."""
         assert _is_public_url("ftp://example.com/data.csv") is False
 
-    def test_localhost_blocked(self) -> None:
-        """Test that localhost URLs are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("127.0.0.1")):
-            assert _is_public_url("http://localhost/api") is False
-            assert _is_public_url("http://localhost:8080/data") is False
-
-    def test_loopback_ip_blocked(self) -> None:
-        """Test that loopback IP addresses are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("127.0.0.1")):
-            assert _is_public_url("http://127.0.0.1/api") is False
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("127.0.0.2")):
-            assert _is_public_url("http://127.0.0.2:8080/data") is False
-
-    def test_private_ip_10_blocked(self) -> None:
-        """Test that private IP addresses (10.x.x.x) are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("10.0.0.1")):
-            assert _is_public_url("http://internal.example.com/api") is False
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("10.255.255.254")):
-            assert _is_public_url("http://10.255.255.254/data") is False
-
-    def test_private_ip_192_168_blocked(self) -> None:
-        """Test that private IP addresses (192.168.x.x) are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("192.168.1.1")):
-            assert _is_public_url("http://router.local/config") is False
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("192.168.100.50")):
-            assert _is_public_url("http://192.168.100.50/api") is False
-
-    def test_private_ip_172_16_blocked(self) -> None:
-        """Test that private IP addresses (172.16-31.x.x) are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("172.16.0.1")):
-            assert _is_public_url("http://internal-app.local/data") is False
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("172.31.255.255")):
-            assert _is_public_url("http://172.31.255.255/api") is False
-
-    def test_link_local_blocked(self) -> None:
-        """Test that link-local addresses (169.254.x.x) are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("169.254.169.254")):
-            assert _is_public_url("http://169.254.169.254/metadata") is False
-
-    def test_cloud_metadata_endpoint_blocked(self) -> None:
-        """Test that AWS/GCP cloud metadata endpoints are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("169.254.169.254")):
-            assert _is_public_url("http://169.254.169.254/latest/meta-data/") is False
-
-    def test_ipv6_loopback_blocked(self) -> None:
-        """Test that IPv6 loopback address (::1) is blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("::1")):
-            assert _is_public_url("http://localhost/api") is False
-            assert _is_public_url("http://[::1]/api") is False
-            assert _is_public_url("http://[::1]:8080/data") is False
-
-    def test_ipv6_link_local_blocked(self) -> None:
-        """Test that IPv6 link-local addresses (fe80::) are blocked."""
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("fe80::1")):
-            assert _is_public_url("http://ipv6-link-local.example.com/data") is False
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("fe80::1234:5678:abcd:ef01")):
-            assert _is_public_url("http://[fe80::1234:5678:abcd:ef01]/api") is False
-
-    def test_ipv6_unique_local_blocked(self) -> None:
-        """Test that IPv6 unique local addresses (fc00::/7, including fd00::) are blocked."""
-        # fc00:: prefix (unique local, not yet assigned)
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("fc00::1")):
-            assert _is_public_url("http://internal-ipv6.example.com/data") is False
-        # fd00:: prefix (unique local, commonly used for private networks)
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("fd00::1")):
-            assert _is_public_url("http://private-ipv6.example.com/api") is False
-        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("fd12:3456:789a::1")):
-            assert _is_public_url("http://[fd12:3456:789a::1]:8080/data") is False
-
     def test_dns_resolution_failure(self) -> None:
         """Test that URLs with unresolvable hostnames are blocked."""
         with patch(
@@ -202,28 +409,64 @@ class TestURLSafety:
         """Test that URLs without hostnames are blocked."""
         assert _is_public_url("http:///no-host") is False
 
-    def test_fetch_from_url_with_ssrf_attempt(self, project_path: Path) -> None:
+    def test_ip_literal_not_resolved(self) -> None:
+        """Test that IP literal hostnames are checked without a DNS lookup."""
+        with patch("sunstone.datasets.socket.getaddrinfo") as getaddrinfo:
+            assert _is_public_url("http://93.184.216.34/data.csv") is True
+            assert _is_public_url("http://10.0.0.1/data.csv") is False
+            assert _is_public_url("http://[fe80::1]/data.csv") is False
+        getaddrinfo.assert_not_called()
+
+    def test_simple_urls_skip_urlparse(self) -> None:
+        """Test that plain URLs are checked without urlparse and others resolve the host urlparse finds."""
+        with patch(
+            "sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34")
+        ) as getaddrinfo:
+            with patch("sunstone.datasets.urlparse") as urlparse:
+                assert _is_public_url("HTTPS://Example.com:443/data.csv?version=2") is True
+            urlparse.assert_not_called()
+            assert getaddrinfo.call_args[0][0] == "example.com"
+
+            assert _is_public_url("https://user@internal.example.com/data.csv") is True
+            assert getaddrinfo.call_args[0][0] == "internal.example.com"
+
+    def test_resolved_hosts_reused(self) -> None:
+        """Test that a shared resolution cache looks up each hostname once."""
+        resolved: dict[str, frozenset[str]] = {}
+        with patch(
+            "sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34") * 3
+        ) as getaddrinfo:
+            assert _is_public_url("https://example.com/old-path", resolved) is True
+            assert _is_public_url("https://example.com/new-path", resolved) is True
+        getaddrinfo.assert_called_once()
+        assert resolved == {"example.com": frozenset({"93.184.216.34"})}
+
+    def test_fetch_from_url_with_ssrf_attempt(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that fetch_from_url raises ValueError for SSRF attempts."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
             # Mock the source URL to point to a private IP
-            dataset.source.location.data = "http://169.254.169.254/metadata"
+            dataset = with_source_url(dataset, "http://169.254.169.254/metadata")
 
             # Mock DNS resolution to return the link-local IP
             with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("169.254.169.254")):
                 with pytest.raises(ValueError, match="not allowed"):
                     manager.fetch_from_url(dataset, force=True)
 
-    def test_fetch_from_url_with_file_scheme(self, project_path: Path) -> None:
+    def test_fetch_from_url_with_file_scheme(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that fetch_from_url raises ValueError for file:// URLs."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
             # Mock the source URL to use file:// scheme
-            dataset.source.location.data = "file:///etc/passwd"
+            dataset = with_source_url(dataset, "file:///etc/passwd")
 
             with pytest.raises(ValueError, match="not allowed"):
                 manager.fetch_from_url(dataset, force=True)
@@ -232,14 +475,16 @@ class TestURLSafety:
 class TestRedirectSSRFProtection:
     """Tests for HTTP redirect SSRF protection."""
 
-    def test_redirect_to_private_ip_blocked(self, project_path: Path) -> None:
+    def test_redirect_to_private_ip_blocked(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that redirects to private IPs are blocked (SSRF bypass prevention)."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
             # Start with a valid public URL
-            dataset.source.location.data = "https://example.com/data.csv"
+            dataset = with_source_url(dataset, "https://example.com/data.csv")
 
             # Mock DNS resolution: initial URL resolves to public, redirect to private
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
@@ -259,13 +504,15 @@ class TestRedirectSSRFProtection:
                     with pytest.raises(ValueError, match="not allowed"):
                         manager.fetch_from_url(dataset, force=True)
 
-    def test_redirect_to_localhost_blocked(self, project_path: Path) -> None:
+    def test_redirect_to_localhost_blocked(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that redirects to localhost are blocked."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
-            dataset.source.location.data = "https://example.com/data.csv"
+            dataset = with_source_url(dataset, "https://example.com/data.csv")
 
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
                 if "example.com" in hostname:
@@ -283,13 +530,15 @@ class TestRedirectSSRFProtection:
                     with pytest.raises(ValueError, match="not allowed"):
                         manager.fetch_from_url(dataset, force=True)
 
-    def test_redirect_to_cloud_metadata_blocked(self, project_path: Path) -> None:
+    def test_redirect_to_cloud_metadata_blocked(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that redirects to cloud metadata endpoints are blocked."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
-            dataset.source.location.data = "https://example.com/data.csv"
+            dataset = with_source_url(dataset, "https://example.com/data.csv")
 
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
                 if "example.com" in hostname:
@@ -307,13 +556,14 @@ class TestRedirectSSRFProtection:
                     with pytest.raises(ValueError, match="not allowed"):
                         manager.fetch_from_url(dataset, force=True)
 
-    def test_redirect_to_public_url_allowed(self, project_path: Path) -> None:
+    def test_redirect_to_public_url_allowed(self, project_path: Path, tmp_path: Path) -> None:
         """Test that redirects to other public URLs are allowed."""
-        manager = sunstone.DatasetsManager(project_path)
+        shutil.copytree(project_path, tmp_path / "project")
+        manager = sunstone.DatasetsManager(tmp_path / "project")
         dataset = manager.find_dataset_by_slug("official-un-member-states")
 
         if dataset and dataset.source:
-            dataset.source.location.data = "https://example.com/old-path"
+            dataset = with_source_url(dataset, "https://example.com/old-path")
 
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
                 # Both URLs resolve to public IPs
@@ -327,7 +577,7 @@ class TestRedirectSSRFProtection:
             mock_final_response = unittest.mock.Mock()
             mock_final_response.is_redirect = False
             mock_final_response.status_code = 200
-            mock_final_response.content = b"test data"
+            mock_final_response.iter_content = unittest.mock.Mock(return_value=[b"test ", b"data"])
             mock_final_response.raise_for_status = unittest.mock.Mock()
 
             with patch("sunstone.datasets.socket.getaddrinfo", side_effect=dns_side_effect):
@@ -335,19 +585,20 @@ class TestRedirectSSRFProtection:
                     "sunstone.datasets.requests.get",
                     side_effect=[mock_redirect_response, mock_final_response],
                 ):
-                    # Mock file writing to avoid modifying test input files
-                    with patch("builtins.open", unittest.mock.mock_open()):
-                        # Should succeed without raising an error
-                        result = manager.fetch_from_url(dataset, force=True)
-                        assert result is not None
-
-    def test_too_many_redirects_blocked(self, project_path: Path) -> None:
+                    # Should succeed without raising an error
+                    result = manager.fetch_from_url(dataset, force=True)
+                    assert result is not None
+                    assert result.read_bytes() == b"test data"
+
+    def test_too_many_redirects_blocked(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that too many redirects are blocked."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
-            dataset.source.location.data = "https://example.com/data.csv"
+            dataset = with_source_url(dataset, "https://example.com/data.csv")
 
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
                 return mock_getaddrinfo("93.184.216.34")  # All public IPs
@@ -362,13 +613,15 @@ class TestRedirectSSRFProtection:
                     with pytest.raises(ValueError, match="Too many redirects"):
                         manager.fetch_from_url(dataset, force=True, max_redirects=5)
 
-    def test_redirect_without_location_header_blocked(self, project_path: Path) -> None:
+    def test_redirect_without_location_header_blocked(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that redirects without Location header are blocked."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
-            dataset.source.location.data = "https://example.com/data.csv"
+            dataset = with_source_url(dataset, "https://example.com/data.csv")
 
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
                 return mock_getaddrinfo("93.184.216.34")
@@ -382,13 +635,15 @@ class TestRedirectSSRFProtection:
                     with pytest.raises(ValueError, match="Location header"):
                         manager.fetch_from_url(dataset, force=True)
 
-    def test_redirect_to_file_scheme_blocked(self, project_path: Path) -> None:
+    def test_redirect_to_file_scheme_blocked(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
         """Test that redirects to file:// URLs are blocked."""
-        manager = sunstone.DatasetsManager(project_path)
-        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        manager = datasets_manager
+        dataset = un_dataset
 
         if dataset and dataset.source:
-            dataset.source.location.data = "https://example.com/data.csv"
+            dataset = with_source_url(dataset, "https://example.com/data.csv")
 
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
                 return mock_getaddrinfo("93.184.216.34")
@@ -402,13 +657,41 @@ class TestRedirectSSRFProtection:
                     with pytest.raises(ValueError, match="not allowed"):
                         manager.fetch_from_url(dataset, force=True)
 
-    def test_relative_redirect_url_resolved(self, project_path: Path) -> None:
+            mock_redirect_response.close.assert_called_once()
+
+    def test_response_closed_on_errors(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata
+    ) -> None:
+        """Test that streamed responses are closed when following redirects or the status check fails."""
+        assert un_dataset.source is not None
+        un_dataset = with_source_url(un_dataset, "https://example.com/data.csv")
+
+        redirect_response = unittest.mock.Mock()
+        redirect_response.is_redirect = True
+        redirect_response.headers = {"Location": "https://example.com/moved.csv"}
+        error_response = unittest.mock.Mock()
+        error_response.is_redirect = False
+        error_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+
+        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34")):
+            with patch("sunstone.datasets.requests.get", return_value=redirect_response):
+                with pytest.raises(ValueError, match="Too many redirects"):
+                    datasets_manager.fetch_from_url(un_dataset, force=True, max_redirects=1)
+            with patch("sunstone.datasets.requests.get", return_value=error_response):
+                with pytest.raises(requests.HTTPError):
+                    datasets_manager.fetch_from_url(un_dataset, force=True)
+
+        assert redirect_response.close.call_count == 2
+        error_response.close.assert_called_once()
+
+    def test_relative_redirect_url_resolved(self, project_path: Path, tmp_path: Path) -> None:
         """Test that relative redirect URLs are properly resolved."""
-        manager = sunstone.DatasetsManager(project_path)
+        shutil.copytree(project_path, tmp_path / "project")
+        manager = sunstone.DatasetsManager(tmp_path / "project")
         dataset = manager.find_dataset_by_slug("official-un-member-states")
 
         if dataset and dataset.source:
-            dataset.source.location.data = "https://example.com/old/data.csv"
+            dataset = with_source_url(dataset, "https://example.com/old/data.csv")
 
             def dns_side_effect(hostname: str, port: Any) -> list[tuple[Any, ...]]:
                 return mock_getaddrinfo("93.184.216.34")  # Public IP
@@ -421,7 +704,7 @@ class TestRedirectSSRFProtection:
             mock_final_response = unittest.mock.Mock()
             mock_final_response.is_redirect = False
             mock_final_response.status_code = 200
-            mock_final_response.content = b"test data"
+            mock_final_response.iter_content = unittest.mock.Mock(return_value=[b"test ", b"data"])
             mock_final_response.raise_for_status = unittest.mock.Mock()
 
             with patch("sunstone.datasets.socket.getaddrinfo", side_effect=dns_side_effect):
@@ -429,12 +712,100 @@ class TestRedirectSSRFProtection:
                     "sunstone.datasets.requests.get",
                     side_effect=[mock_redirect_response, mock_final_response],
                 ) as mock_get:
-                    # Mock file writing to avoid modifying test input files
-                    with patch("builtins.open", unittest.mock.mock_open()):
-                        result = manager.fetch_from_url(dataset, force=True)
-                        assert result is not None
-                        # Verify the relative URL was resolved to the correct absolute URL
-                        # The second call should be to the resolved URL: https://example.com/new/data.csv
-                        assert mock_get.call_count == 2
-                        second_call_url = mock_get.call_args_list[1][0][0]
-                        assert second_call_url == "https://example.com/new/data.csv"
+                    result = manager.fetch_from_url(dataset, force=True)
+                    assert result is not None
+                    # Verify the relative URL was resolved to the correct absolute URL
+                    # The second call should be to the resolved URL: https://example.com/new/data.csv
+                    assert mock_get.call_count == 2
+                    second_call_url = mock_get.call_args_list[1][0][0]
+                    assert second_call_url == "https://example.com/new/data.csv"
+
+
+class TestFetchMany:
+    """Tests for fetching several datasets concurrently."""
+
+    def test_fetch_many_returns_paths_in_order(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that fetch_many downloads every dataset and keeps their order."""
+        import shutil
+
+        test_project = tmp_path / "test_project"
+        shutil.copytree(project_path, test_project)
+        manager = sunstone.DatasetsManager(test_project)
+        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        assert dataset is not None and dataset.source is not None
+
+        datasets = [
+            dataclasses.replace(
+                dataset,
+                location=f"downloads/{name}.csv",
+                source=dataclasses.replace(
+                    dataset.source,
+                    location=sunstone.SourceLocation(data=f"https://example.com/{name}.csv"),
+                ),
+            )
+            for name in ("first", "second", "third")
+        ]
+
+        def get_side_effect(url: str, **kwargs: Any) -> unittest.mock.Mock:
+            response = unittest.mock.Mock()
+            response.is_redirect = False
+            response.iter_content.return_value = [url.encode()]
+            return response
+
+        with patch(
+            "sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34")
+        ) as getaddrinfo:
+            with patch("sunstone.datasets.requests.get", side_effect=get_side_effect):
+                paths = manager.fetch_many(datasets, force=True)
+
+        # All three datasets come from one host, which is resolved once
+        getaddrinfo.assert_called_once()
+
+        assert paths == [test_project / "downloads" / f"{name}.csv" for name in ("first", "second", "third")]
+        assert paths[1].read_bytes() == b"https://example.com/second.csv"
+
+    @pytest.mark.parametrize("count", [1, 2])
+    def test_fetch_many_max_redirects(
+        self, datasets_manager: sunstone.DatasetsManager, un_dataset: DatasetMetadata, count: int
+    ) -> None:
+        """Test that fetch_many applies max_redirects, including when fetching a single dataset."""
+        assert un_dataset.source is not None
+        un_dataset = with_source_url(un_dataset, "https://example.com/data.csv")
+
+        response = unittest.mock.Mock()
+        response.is_redirect = True
+        response.headers = {"Location": "https://example.com/moved.csv"}
+
+        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34")):
+            with patch("sunstone.datasets.requests.get", return_value=response) as mock_get:
+                with pytest.raises(ValueError, match=r"Too many redirects \(max: 2\)"):
+                    datasets_manager.fetch_many([un_dataset] * count, force=True, max_redirects=2)
+
+        # The initial request and two redirects for each dataset
+        assert mock_get.call_count == 3 * count
+
+    def test_failed_download_keeps_existing_file(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that an interrupted download leaves the existing local file untouched."""
+        shutil.copytree(project_path, tmp_path / "project")
+        manager = sunstone.DatasetsManager(tmp_path / "project")
+        dataset = manager.find_dataset_by_slug("official-un-member-states")
+        assert dataset is not None and dataset.source is not None
+        dataset = with_source_url(dataset, "https://example.com/data.csv")
+        local_path = manager.get_absolute_path(dataset.location)
+        original = local_path.read_bytes()
+
+        def interrupted_download(chunk_size: int) -> Any:
+            yield b"partial"
+            raise requests.ConnectionError("connection reset")
+
+        response = unittest.mock.Mock()
+        response.is_redirect = False
+        response.iter_content.side_effect = interrupted_download
+
+        with patch("sunstone.datasets.socket.getaddrinfo", return_value=mock_getaddrinfo("93.184.216.34")):
+            with patch("sunstone.datasets.requests.get", return_value=response):
+                with pytest.raises(requests.ConnectionError):
+                    manager.fetch_from_url(dataset, force=True)
+
+        assert local_path.read_bytes() == original
+        assert not list(local_path.parent.glob(local_path.name + ".*.tmp"))
@@ -1,4 +1,7 @@
 from pathlib import Path
+from typing import Callable
+
+import pandas as pd
 
 import sunstone
 
@@ -6,11 +9,9 @@ import sunstone
 class TestLineagePersistence:
     """Tests to ensure lineage is preserved through standard pandas operations."""
 
-    def test_head_preserves_lineage(self, project_path: Path) -> None:
+    def test_head_preserves_lineage(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
         """Test that head() returns a sunstone DataFrame with lineage."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False
-        )
+        df = read_un_members()
 
         # operation
         result = df.head(5)
@@ -22,11 +23,9 @@ class TestLineagePersistence:
         assert hasattr(result, "lineage")
         assert len(result.lineage.sources) == len(df.lineage.sources)
 
-    def test_getitem_preserves_lineage(self, project_path: Path) -> None:
+    def test_getitem_preserves_lineage(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
         """Test that boolean indexing/getitem returns sunstone DataFrame."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False
-        )
+        df = read_un_members()
 
         # Let's just slice columns, which returns a DataFrame
         result = df[["Member State", "ISO Code"]]
@@ -34,22 +33,18 @@ class TestLineagePersistence:
         assert isinstance(result, sunstone.DataFrame)
         assert len(result.lineage.sources) == len(df.lineage.sources)
 
-    def test_sort_values_preserves_lineage(self, project_path: Path) -> None:
+    def test_sort_values_preserves_lineage(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
         """Test that sort_values returns sunstone DataFrame."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False
-        )
+        df = read_un_members()
 
         result = df.sort_values("Member State")
 
         assert isinstance(result, sunstone.DataFrame)
         assert len(result.lineage.sources) == len(df.lineage.sources)
 
-    def test_setitem_preserves_lineage(self, project_path: Path) -> None:
+    def test_setitem_preserves_lineage(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
         """Test that in-place modification preserves lineage."""
-        df = sunstone.DataFrame.read_csv(
-            "inputs/official_un_member_states_raw.csv", project_path=project_path, strict=False
-        )
+        df = read_un_members()
 
         initial_sources = len(df.lineage.sources)
         df["NewCol"] = 1
@@ -57,3 +52,139 @@ class TestLineagePersistence:
         assert "NewCol" in df.data.columns
         # Lineage sources should be preserved after setitem
         assert len(df.lineage.sources) == initial_sources
+
+    def test_self_merge_shares_lineage_sources(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
+        """Test that merging a DataFrame with a view of itself doesn't duplicate sources."""
+        df = read_un_members()
+        left = df[["Member State", "ISO Code"]]
+        right = df[["ISO Code", "Start date"]]
+
+        merged = left.merge(right, on="ISO Code")
+
+        assert merged.lineage.sources == df.lineage.sources
+        assert merged.lineage.sources is df.lineage.sources
+
+    def test_merge_with_empty_lineage(
+        self, project_path: Path, read_un_members: Callable[..., sunstone.DataFrame]
+    ) -> None:
+        """Test that merging with a DataFrame without sources keeps the existing sources."""
+        df = read_un_members()
+        codes = sunstone.DataFrame({"ISO Code": ["FRA", "DEU"]}, project_path=project_path)
+
+        assert df.merge(codes, on="ISO Code").lineage.sources == df.lineage.sources
+        assert codes.merge(df, on="ISO Code").lineage.sources == df.lineage.sources
+
+    def test_chained_operations_defer_lineage(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
+        """Test that intermediate results only create lineage when it is read."""
+        df = read_un_members()
+
+        intermediate = df.sort_values("Member State")
+        result = intermediate.head(5)
+
+        assert result.lineage.sources == df.lineage.sources
+        assert result.lineage.project_path == df.lineage.project_path
+        assert result.strict_mode is df.strict_mode
+        assert intermediate._lineage is None
+
+    def test_merge_deduplicates_sources_by_slug(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
+        """Test that merging lineages read separately keeps one source per slug."""
+        first = read_un_members()
+        second = read_un_members()
+
+        combined = first.concat([second, first.head(5)])
+
+        assert [source.slug for source in combined.lineage.sources] == ["official-un-member-states"]
+
+    def test_repr_does_not_create_lineage(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
+        """Test that printing a derived DataFrame reports its sources without creating its lineage."""
+        df = read_un_members()
+
+        result = df.head(5)
+
+        assert repr(result).endswith("Lineage: 1 source(s)")
+        assert result._lineage is None
+
+
+class TestComputeDataFrameHash:
+    """Tests for content hashes of DataFrames."""
+
+    def test_hash_depends_on_content(self) -> None:
+        """Test that equal DataFrames hash alike and any change to values, order, names or dtypes changes the hash."""
+        from sunstone.lineage import compute_dataframe_hash
+
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+        assert compute_dataframe_hash(df) == compute_dataframe_hash(df.copy())
+        assert len(compute_dataframe_hash(df)) == 64
+        for changed in (
+            df.assign(a=[1, 3]),
+            df.iloc[::-1],
+            df[["b", "a"]],
+            df.rename(columns={"a": "c"}),
+            df.astype({"a": "float64"}),
+        ):
+            assert compute_dataframe_hash(changed) != compute_dataframe_hash(df)
+
+    def test_hash_object_column_types(self) -> None:
+        """Test that object columns holding equal-looking values of different types hash differently."""
+        from sunstone.lineage import compute_dataframe_hash
+
+        numbers = pd.DataFrame({"a": pd.Series([1, 2], dtype=object)})
+        strings = pd.DataFrame({"a": pd.Series(["1", "2"], dtype=object)})
+
+        assert compute_dataframe_hash(numbers) != compute_dataframe_hash(strings)
+        assert compute_dataframe_hash(strings) != compute_dataframe_hash(strings.astype("string"))
+
+    def test_hash_unhashable_values(self) -> None:
+        """Test that DataFrames holding unhashable values can still be hashed."""
+        from sunstone.lineage import compute_dataframe_hash
+
+        df = pd.DataFrame({"a": [[1], [2]]})
+
+        assert compute_dataframe_hash(df) == compute_dataframe_hash(df.copy())
+
+
+class TestGetLicenses:
+    """Tests for collecting the licenses of lineage sources."""
+
+    def test_licenses_follow_added_sources(self) -> None:
+        """Test that licenses reflect sources added after they were first computed."""
+        from sunstone.lineage import DatasetMetadata, LineageMetadata, Source, SourceLocation
+
+        def dataset(slug: str, license: str) -> DatasetMetadata:
+            source = Source(
+                name=slug,
+                location=SourceLocation(),
+                attributed_to=slug,
+                acquired_at="2025-01-01",
+                acquisition_method="manual-download",
+                license=license,
+            )
+            return DatasetMetadata(name=slug, slug=slug, location=f"{slug}.csv", fields=[], source=source)
+
+        lineage = LineageMetadata(sources=[dataset("a", "MIT")])
+        assert lineage.get_licenses() == ["MIT"]
+
+        derived = lineage.derive()
+        derived.add_source(dataset("b", "CC-BY-4.0"))
+        assert derived.get_licenses() == ["CC-BY-4.0", "MIT"]
+        assert lineage.get_licenses() == ["MIT"]
+
+        lineage.add_source(dataset("c", "MIT"))
+        lineage.get_licenses().append("modified")
+        assert lineage.get_licenses() == ["MIT"]
+
+        lineage.sources[0] = dataset("d", "Apache-2.0")
+        assert lineage.get_licenses() == ["Apache-2.0", "MIT"]
+
+
+class TestLineageSerialization:
+    """Tests for serializing lineage metadata."""
+
+    def test_to_json_matches_to_dict(self, read_un_members: Callable[..., sunstone.DataFrame]) -> None:
+        """Test that to_json() encodes the same data as to_dict()."""
+        import json
+
+        df = read_un_members()
+
+        assert json.loads(df.lineage.to_json()) == df.lineage.to_dict()
@@ -0,0 +1,159 @@
+"""
+Tests for Sunstone import validation.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from sunstone import validation
+from sunstone.validation import (
+    check_notebook_imports,
+    check_script_imports,
+    validate_project_notebooks,
+    validate_project_notebooks_async,
+)
+
+
+class TestCheckScriptImports:
+    """Tests for checking the imports of Python scripts."""
+
+    def test_sunstone_pandas_import_is_valid(self, tmp_path: Path) -> None:
+        """Test that scripts importing sunstone's pandas module pass."""
+        script = tmp_path / "analysis.py"
+        script.write_text("# import pandas as pd\nfrom sunstone import pandas as pd\n\ndf = pd.read_csv('x.csv')\n")
+
+        result = check_script_imports(script)
+
+        assert result.is_valid
+        assert result.has_sunstone_pandas
+        assert result.has_sunstone
+        assert not result.has_plain_pandas
+
+    def test_plain_pandas_imports_are_located(self, tmp_path: Path) -> None:
+        """Test that every plain pandas import is reported with its line number."""
+        script = tmp_path / "analysis.py"
+        script.write_text(
+            "import sunstone\r\nimport pandas as pd\r\n\r\n    from pandas import DataFrame\r\nimport pandasx\r\n"
+        )
+
+        result = check_script_imports(script)
+
+        assert not result.is_valid
+        assert result.has_sunstone
+        assert not result.has_sunstone_pandas
+        assert result.plain_pandas_locations == ["analysis.py:2", "analysis.py:4"]
+
+    def test_no_sunstone_import_is_invalid(self, tmp_path: Path) -> None:
+        """Test that scripts without any sunstone import fail."""
+        script = tmp_path / "analysis.py"
+        script.write_text("import sunstonex\nimport os\n")
+
+        result = check_script_imports(script)
+
+        assert not result.is_valid
+        assert not result.has_sunstone
+
+    def test_fast_check_stops_at_first_plain_pandas_import(self, tmp_path: Path) -> None:
+        """Test that a fast check reports the first plain pandas import and the same verdict."""
+        script = tmp_path / "analysis.py"
+        script.write_text("import pandas as pd\nimport sunstone\nimport pandas\n")
+
+        result = check_script_imports(script, fast=True)
+
+        assert not result.is_valid
+        assert result.plain_pandas_locations == ["analysis.py:1"]
+
+    def test_fast_check_summary_reports_only_plain_pandas(self, tmp_path: Path) -> None:
+        """Test that a fast check's summary doesn't claim sunstone imports it never reached are missing."""
+        script = tmp_path / "analysis.py"
+        script.write_text("import pandas as pd\nimport sunstone\n")
+
+        fast = check_script_imports(script, fast=True)
+
+        assert fast.stopped_early
+        assert "Found plain pandas imports" in fast.summary()
+        assert "No sunstone imports found" not in fast.summary()
+        assert fast.summary() == check_script_imports(script).summary()
+
+
+class TestCheckNotebookImports:
+    """Tests for checking the imports of Jupyter notebooks."""
+
+    def test_unchanged_notebook_is_checked_once(self, tmp_path: Path) -> None:
+        """Test that results are reused until the notebook changes, and can't be modified through a copy."""
+        notebook = tmp_path / "analysis.ipynb"
+        notebook.write_text(json.dumps({"cells": [{"cell_type": "code", "source": ["import pandas as pd\n"]}]}))
+
+        with patch.object(validation, "_load_notebook", wraps=validation._load_notebook) as load:
+            first = check_notebook_imports(notebook)
+            first.plain_pandas_locations.append("modified")
+            second = check_notebook_imports(notebook)
+            assert load.call_count == 1
+
+            notebook.write_text(json.dumps({"cells": [{"cell_type": "code", "source": ["import sunstone\n"]}]}))
+            third = check_notebook_imports(notebook)
+            assert load.call_count == 2
+
+        assert second.plain_pandas_locations == ["Cell 1:1"]
+        assert third.is_valid
+
+    def test_missing_notebook_is_reported(self, tmp_path: Path) -> None:
+        """Test that a missing notebook is reported as an error."""
+        result = check_notebook_imports(tmp_path / "missing.ipynb")
+
+        assert not result.is_valid
+        assert result.errors == [f"Notebook not found: {tmp_path / 'missing.ipynb'}"]
+
+
+class TestValidateProjectNotebooks:
+    """Tests for validating all notebooks of a project."""
+
+    def test_validates_each_notebook(self, tmp_path: Path) -> None:
+        """Test that every notebook outside checkpoints is checked and keyed by relative path."""
+
+        def write_notebook(path: Path, *sources: str) -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            cells = [{"cell_type": "code", "source": source.splitlines(keepends=True)} for source in sources]
+            path.write_text(json.dumps({"cells": cells}))
+
+        for i in range(5):
+            write_notebook(tmp_path / "notebooks" / f"valid_{i}.ipynb", "from sunstone import pandas as pd\n")
+        write_notebook(tmp_path / "invalid.ipynb", "import sunstone\n", "x = 1\nimport pandas as pd\n")
+        write_notebook(tmp_path / ".ipynb_checkpoints" / "invalid-checkpoint.ipynb", "import pandas as pd\n")
+        write_notebook(tmp_path / "node_modules" / "pkg" / "example.ipynb", "import pandas as pd\n")
+
+        results = validate_project_notebooks(tmp_path, max_workers=2)
+
+        assert sorted(results) == ["invalid.ipynb"] + [f"notebooks/valid_{i}.ipynb" for i in range(5)]
+        assert [path for path, result in results.items() if not result.is_valid] == ["invalid.ipynb"]
+        assert results["invalid.ipynb"].plain_pandas_locations == ["Cell 2:2"]
+
+    def test_custom_pattern_is_globbed(self, tmp_path: Path) -> None:
+        """Test that a non-default pattern only matches the notebooks it selects."""
+        (tmp_path / "notebooks").mkdir()
+        (tmp_path / "notebooks" / "a.ipynb").write_text('{"cells": []}')
+        (tmp_path / "b.ipynb").write_text('{"cells": []}')
+
+        results = validate_project_notebooks(tmp_path, pattern="notebooks/*.ipynb")
+
+        assert list(results) == ["notebooks/a.ipynb"]
+
+    def test_async_matches_sync(self, tmp_path: Path) -> None:
+        """Test that the coroutine version finds and checks the same notebooks."""
+        (tmp_path / "notebooks").mkdir()
+        (tmp_path / "notebooks" / "a.ipynb").write_text(
+            json.dumps({"cells": [{"cell_type": "code", "source": ["import pandas as pd\n"]}]})
+        )
+        (tmp_path / "b.ipynb").write_text(
+            json.dumps({"cells": [{"cell_type": "code", "source": ["import sunstone\n"]}]})
+        )
+
+        results = asyncio.run(validate_project_notebooks_async(tmp_path))
+
+        expected = validate_project_notebooks(tmp_path)
+        assert sorted(results) == sorted(expected) == ["b.ipynb", "notebooks/a.ipynb"]
+        assert {path: result.is_valid for path, result in results.items()} == {
+            path: result.is_valid for path, result in expected.items()
+        }